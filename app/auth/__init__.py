@@ -2,10 +2,52 @@
 
 Thin re-export layer over gofr-common auth, mirroring the pattern used by other
 GOFR services.
+
+Names are resolved lazily (PEP 562) so importing ``app.auth`` does not pull in
+gofr-common auth or the Vault wiring until a caller actually uses them.
 """
 
-from gofr_common.auth import AuthService, TokenInfo
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from gofr_common.auth import AuthService, TokenInfo
+
+    from .factory import (
+        create_auth_service,
+        get_auth_service,
+        is_auth_disabled,
+        reset_auth_disabled_cache,
+        reset_auth_service_cache,
+    )
+
+# Public name -> module that defines it (relative names resolve against this package).
+_LAZY = {
+    "AuthService": "gofr_common.auth",
+    "TokenInfo": "gofr_common.auth",
+    "create_auth_service": ".factory",
+    "get_auth_service": ".factory",
+    "is_auth_disabled": ".factory",
+    "reset_auth_disabled_cache": ".factory",
+    "reset_auth_service_cache": ".factory",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
 
-from .factory import create_auth_service, is_auth_disabled
 
-__all__ = ["AuthService", "TokenInfo", "create_auth_service", "is_auth_disabled"]
+__all__ = [
+    "AuthService",
+    "TokenInfo",
+    "create_auth_service",
+    "get_auth_service",
+    "is_auth_disabled",
+    "reset_auth_disabled_cache",
+    "reset_auth_service_cache",
+]
@@ -7,16 +7,36 @@ the same wiring.
 
 from __future__ import annotations
 
+import hashlib
 import os
-from typing import Mapping, Optional
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Mapping, Optional, Tuple
 
-from gofr_common.auth import AuthService, GroupRegistry, JwtSecretProvider
+from gofr_common.auth import AuthService, GroupRegistry, JwtSecretProvider, TokenInfo
 from gofr_common.auth.backends import create_stores_from_env, create_vault_client_from_env
 from gofr_common.logger import Logger
 
 
 DEFAULT_ENV_PREFIX = "GOFR_NP"
 DEFAULT_AUDIENCE = "gofr-api"
+DEFAULT_JWT_CACHE_MAX = 10_000
+DEFAULT_JWT_CACHE_TTL = 5.0
+
+# Resolved GOFR_NP_NO_AUTH value for the process environment (None = not yet read).
+_AUTH_DISABLED_CACHE: Optional[bool] = None
+_AUTH_DISABLED_LOCK = threading.Lock()
+
+# One Vault client per env prefix, so repeated wiring reuses its HTTP session.
+_VAULT_CLIENT_CACHE: dict[str, Any] = {}
+_VAULT_CLIENT_LOCK = threading.Lock()
+
+# One AuthService per (env prefix, audience), so repeated wiring in one
+# process does not rebuild stores, registry and secret provider.
+_AUTH_SERVICE_CACHE: dict[Tuple[str, str], AuthService] = {}
+_AUTH_SERVICE_LOCK = threading.Lock()
 
 
 def is_auth_disabled(*, no_auth_flag: bool = False, env: Optional[Mapping[str, str]] = None) -> bool:
@@ -24,12 +44,161 @@ def is_auth_disabled(*, no_auth_flag: bool = False, env: Optional[Mapping[str, s
 
     Note: prod and tests are expected to run with auth enabled.
     This exists for local development parity only.
+
+    The process environment is read once and cached; an explicit non-empty ``env``
+    mapping is always evaluated fresh.
     """
 
-    env_map = env or os.environ
+    global _AUTH_DISABLED_CACHE
+
     if no_auth_flag:
         return True
-    return env_map.get("GOFR_NP_NO_AUTH", "").strip() == "1"
+    if env:
+        return env.get("GOFR_NP_NO_AUTH", "").strip() == "1"
+
+    cached = _AUTH_DISABLED_CACHE
+    if cached is not None:
+        return cached
+    with _AUTH_DISABLED_LOCK:
+        if _AUTH_DISABLED_CACHE is None:
+            _AUTH_DISABLED_CACHE = os.environ.get("GOFR_NP_NO_AUTH", "").strip() == "1"
+        return _AUTH_DISABLED_CACHE
+
+
+def reset_auth_disabled_cache() -> None:
+    """Forget the cached GOFR_NP_NO_AUTH value (tests that mutate os.environ)."""
+
+    global _AUTH_DISABLED_CACHE
+    with _AUTH_DISABLED_LOCK:
+        _AUTH_DISABLED_CACHE = None
+
+
+def _vault_client_usable(client: Any) -> bool:
+    check = getattr(client, "is_authenticated", None)
+    if not callable(check):
+        return True
+    try:
+        return bool(check())
+    except Exception:
+        return False
+
+
+def get_vault_client(env_prefix: str = DEFAULT_ENV_PREFIX, *, logger: Logger) -> Any:
+    """Return the shared Vault client for env_prefix, rebuilding it if its session lapsed."""
+
+    with _VAULT_CLIENT_LOCK:
+        client = _VAULT_CLIENT_CACHE.get(env_prefix)
+        if client is None or not _vault_client_usable(client):
+            client = create_vault_client_from_env(env_prefix, logger=logger)
+            _VAULT_CLIENT_CACHE[env_prefix] = client
+        return client
+
+
+def reset_vault_client_cache() -> None:
+    """Drop cached Vault clients (tests that swap Vault credentials)."""
+
+    with _VAULT_CLIENT_LOCK:
+        _VAULT_CLIENT_CACHE.clear()
+
+
+def _token_expiry(token_info: TokenInfo) -> Optional[float]:
+    """Return the token expiry as a UNIX timestamp, if TokenInfo exposes one."""
+
+    for attr in ("expires_at", "exp"):
+        value = getattr(token_info, attr, None)
+        if isinstance(value, datetime):
+            return value.timestamp()
+        if isinstance(value, (int, float)):
+            return float(value)
+    return None
+
+
+class VerifyingTokenCache:
+    """Bounded TTL cache of verified tokens.
+
+    Keys are a truncated SHA-256 digest of the raw token so bearer tokens are
+    never held in memory as dictionary keys. Entries never outlive the token's
+    own expiry.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_JWT_CACHE_MAX, ttl: float = DEFAULT_JWT_CACHE_TTL):
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._entries: OrderedDict[bytes, Tuple[float, TokenInfo]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self._maxsize > 0 and self._ttl > 0
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()[:16]
+
+    def get(self, token: str) -> Optional[TokenInfo]:
+        if not self.enabled:
+            return None
+        key = self._key(token)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            deadline, token_info = entry
+            if deadline <= now:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return token_info
+
+    def put(self, token: str, token_info: TokenInfo) -> None:
+        if not self.enabled:
+            return
+        ttl = self._ttl
+        expiry = _token_expiry(token_info)
+        if expiry is not None:
+            ttl = min(ttl, expiry - time.time())
+        if ttl <= 0:
+            return
+        key = self._key(token)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, token_info)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class CachingAuthService(AuthService):
+    """AuthService that short-circuits repeat verification of the same token."""
+
+    def __init__(self, *, token_cache: VerifyingTokenCache, **kwargs: Any):
+        super().__init__(**kwargs)
+        self._token_cache = token_cache
+
+    def verify_token(self, token: str, *args: Any, **kwargs: Any) -> TokenInfo:
+        # Only the plain verify path is cached; option-bearing calls go straight through.
+        if args or kwargs:
+            return super().verify_token(token, *args, **kwargs)
+
+        cached = self._token_cache.get(token)
+        if cached is not None:
+            return cached
+
+        token_info = super().verify_token(token)
+        self._token_cache.put(token, token_info)
+        return token_info
+
+
+def create_token_cache(env_prefix: str = DEFAULT_ENV_PREFIX) -> VerifyingTokenCache:
+    """Build a VerifyingTokenCache sized from <PREFIX>_JWT_CACHE_MAX / _JWT_CACHE_TTL."""
+
+    maxsize = int(os.environ.get(f"{env_prefix}_JWT_CACHE_MAX", DEFAULT_JWT_CACHE_MAX))
+    ttl = float(os.environ.get(f"{env_prefix}_JWT_CACHE_TTL", DEFAULT_JWT_CACHE_TTL))
+    return VerifyingTokenCache(maxsize=maxsize, ttl=ttl)
 
 
 def create_auth_service(
@@ -40,7 +209,7 @@ def create_auth_service(
 ) -> AuthService:
     """Create a Vault-backed gofr-common AuthService for gofr-np."""
 
-    vault_client = create_vault_client_from_env(env_prefix, logger=logger)
+    vault_client = get_vault_client(env_prefix, logger=logger)
 
     vault_path = os.environ.get(
         f"{env_prefix}_JWT_SECRET_VAULT_PATH",
@@ -57,7 +226,8 @@ def create_auth_service(
     # Runtime services should not bootstrap groups; groups/tokens are seeded by platform bootstrap.
     group_registry = GroupRegistry(store=group_store, logger=logger, auto_bootstrap=False)
 
-    return AuthService(
+    return CachingAuthService(
+        token_cache=create_token_cache(env_prefix),
         token_store=token_store,
         group_registry=group_registry,
         secret_provider=secret_provider,
@@ -65,3 +235,27 @@ def create_auth_service(
         audience=audience,
         logger=logger,
     )
+
+
+def get_auth_service(
+    *,
+    env_prefix: str = DEFAULT_ENV_PREFIX,
+    audience: str = DEFAULT_AUDIENCE,
+    logger: Logger,
+) -> AuthService:
+    """Return the process-wide AuthService for env_prefix/audience, creating it once."""
+
+    key = (env_prefix, audience)
+    with _AUTH_SERVICE_LOCK:
+        service = _AUTH_SERVICE_CACHE.get(key)
+        if service is None:
+            service = create_auth_service(env_prefix=env_prefix, audience=audience, logger=logger)
+            _AUTH_SERVICE_CACHE[key] = service
+        return service
+
+
+def reset_auth_service_cache() -> None:
+    """Drop cached AuthService instances (tests that swap auth configuration)."""
+
+    with _AUTH_SERVICE_LOCK:
+        _AUTH_SERVICE_CACHE.clear()
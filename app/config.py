@@ -3,6 +3,7 @@
 Re-exports configuration from gofr_common.config with GOFR_NP prefix.
 """
 
+import functools
 from pathlib import Path
 
 from gofr_common.config import (
@@ -13,14 +14,15 @@ from gofr_common.config import (
     StorageSettings,
     LogSettings,
     get_settings as _get_settings,
-    reset_settings,
+    reset_settings as _reset_settings,
 )
 
 # Project-specific prefix
 _ENV_PREFIX = "GOFR_NP"
 
-# Project root for default data directory
-_PROJECT_ROOT = Path(__file__).parent.parent
+# Project root for default data directory (resolved once so downstream
+# path handling never re-resolves it)
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
 
 
 class Config(BaseConfig):
@@ -28,43 +30,93 @@ class Config(BaseConfig):
 
     _env_prefix = _ENV_PREFIX
 
+    @classmethod
+    def set_test_mode(cls, *args, **kwargs):
+        super().set_test_mode(*args, **kwargs)
+        _clear_caches()
 
-def get_settings(reload: bool = False, require_auth: bool = True) -> Settings:
-    """Get settings with GOFR_NP prefix"""
+    @classmethod
+    def clear_test_mode(cls, *args, **kwargs):
+        super().clear_test_mode(*args, **kwargs)
+        _clear_caches()
+
+
+@functools.lru_cache(maxsize=4)
+def _cached_settings(require_auth: bool) -> Settings:
     return _get_settings(
         prefix=_ENV_PREFIX,
-        reload=reload,
+        reload=False,
         require_auth=require_auth,
         project_root=_PROJECT_ROOT,
     )
 
 
-# Convenience functions
+def get_settings(reload: bool = False, require_auth: bool = True) -> Settings:
+    """Get settings with GOFR_NP prefix (memoized unless reload=True)"""
+    if reload:
+        _cached_settings.cache_clear()
+        return _get_settings(
+            prefix=_ENV_PREFIX,
+            reload=True,
+            require_auth=require_auth,
+            project_root=_PROJECT_ROOT,
+        )
+    return _cached_settings(require_auth)
+
+
+def reset_settings() -> None:
+    """Reset cached settings, the memoized directory helpers below and the auth-disabled flag"""
+    # Local import: keeps gofr-common auth off the config import path
+    from app.auth.factory import reset_auth_disabled_cache
+
+    _reset_settings()
+    _clear_caches()
+    reset_auth_disabled_cache()
+
+
+# Convenience functions (memoized; cleared by reset_settings and test-mode changes)
+@functools.lru_cache(maxsize=1)
 def get_public_storage_dir() -> str:
     """Get public storage directory as string"""
     return str(Config.get_storage_dir() / "public")
 
 
+@functools.lru_cache(maxsize=1)
 def get_default_storage_dir() -> str:
     """Get default storage directory as string"""
     return str(Config.get_storage_dir())
 
 
+@functools.lru_cache(maxsize=1)
 def get_default_token_store_path() -> str:
     """Get default token store path as string"""
     return str(Config.get_token_store_path())
 
 
+@functools.lru_cache(maxsize=1)
 def get_default_sessions_dir() -> str:
     """Get default sessions directory as string"""
     return str(Config.get_sessions_dir())
 
 
+@functools.lru_cache(maxsize=1)
 def get_default_proxy_dir() -> str:
     """Get default proxy directory as string"""
     return str(Config.get_proxy_dir())
 
 
+def _clear_caches() -> None:
+    for helper in (
+        _cached_settings,
+        get_public_storage_dir,
+        get_default_storage_dir,
+        get_default_token_store_path,
+        get_default_sessions_dir,
+        get_default_proxy_dir,
+    ):
+        helper.cache_clear()
+
+
 __all__ = [
     "Config",
     "Settings",
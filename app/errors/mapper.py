@@ -4,8 +4,10 @@ Converts structured GofrNpError exceptions into standardized error responses
 with machine-readable error codes and recovery strategies.
 """
 
+import sys
 from dataclasses import dataclass
-from typing import Dict, Any, Optional
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional
 
 from app.exceptions import (
     GofrNpError,
@@ -14,10 +16,15 @@ from app.exceptions import (
     SecurityError,
 )
 
+try:
+    from pydantic import ValidationError as _PydanticValidationError
+except ImportError:  # pragma: no cover - pydantic ships with gofr-common
+    _PydanticValidationError = None
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class ErrorResponse:
-    """Structured error response for API consumers."""
+    """Structured error response for API consumers (immutable, slotted)."""
 
     error_code: str
     message: str
@@ -25,16 +32,27 @@ class ErrorResponse:
     recovery_strategy: Optional[str] = None
 
 
-# Recovery strategy templates for common error types
-RECOVERY_STRATEGIES: Dict[str, str] = {
-    "REGISTRY_ERROR": "Check that the tool or capability name is valid and exists in the system.",
-    "VALIDATION_ERROR": "Review the error message and adjust the request parameters accordingly.",
-    "RESOURCE_NOT_FOUND": "Verify the resource ID is correct and the resource exists.",
-    "SECURITY_ERROR": "Ensure your authentication token has access to the requested resource.",
-    "INVALID_INPUT": "Check the input parameters. Ensure arrays have correct dimensions and values are within valid ranges.",
-    "COMPUTATION_ERROR": "The computation failed. This might be due to numerical instability, overflow, or invalid mathematical operations.",
-    "MATH_ERROR": "A general math error occurred. Check input values for domain errors (e.g., sqrt of negative number).",
-}
+# Recovery strategy templates for common error types, as (code, strategy) pairs.
+# Register new codes here; RECOVERY_STRATEGIES is the read-only view built below.
+_RECOVERY_STRATEGY_PAIRS = (
+    ("REGISTRY_ERROR", "Check that the tool or capability name is valid and exists in the system."),
+    ("VALIDATION_ERROR", "Review the error message and adjust the request parameters accordingly."),
+    ("RESOURCE_NOT_FOUND", "Verify the resource ID is correct and the resource exists."),
+    ("SECURITY_ERROR", "Ensure your authentication token has access to the requested resource."),
+    ("INVALID_INPUT", "Check the input parameters. Ensure arrays have correct dimensions and values are within valid ranges."),
+    ("COMPUTATION_ERROR", "The computation failed. This might be due to numerical instability, overflow, or invalid mathematical operations."),
+    ("MATH_ERROR", "A general math error occurred. Check input values for domain errors (e.g., sqrt of negative number)."),
+)
+
+# Keys are interned; error codes are string literals, so lookups usually hit on
+# identity before falling back to equality.
+RECOVERY_STRATEGIES: Mapping[str, str] = MappingProxyType(
+    {sys.intern(code): strategy for code, strategy in _RECOVERY_STRATEGY_PAIRS}
+)
+
+_DEFAULT_RECOVERY = "Review the error message, adjust the request, and try again."
+_PYDANTIC_RECOVERY = "Check the error details and provide valid input according to the schema."
+_INTERNAL_RECOVERY = "An unexpected error occurred. Please report this issue if it persists."
 
 
 def get_recovery_strategy(error_code: str) -> str:
@@ -46,9 +64,7 @@ def get_recovery_strategy(error_code: str) -> str:
     Returns:
         Recovery strategy string
     """
-    return RECOVERY_STRATEGIES.get(
-        error_code, "Review the error message, adjust the request, and try again."
-    )
+    return RECOVERY_STRATEGIES.get(error_code, _DEFAULT_RECOVERY)
 
 
 def map_exception_to_response(error: Exception) -> ErrorResponse:
@@ -61,24 +77,23 @@ def map_exception_to_response(error: Exception) -> ErrorResponse:
         ErrorResponse with structured error information
     """
     if isinstance(error, GofrNpError):
-        # Structured GOFRNP error with code, message, details
+        # Structured GOFRNP error with code, message, details (each read once)
+        code = error.code
         return ErrorResponse(
-            error_code=error.code,
-            message=error.message,
-            details=error.details if error.details else None,
-            recovery_strategy=get_recovery_strategy(error.code),
+            code,
+            error.message,
+            error.details or None,
+            RECOVERY_STRATEGIES.get(code, _DEFAULT_RECOVERY),
         )
 
     # Handle Pydantic validation errors
-    from pydantic import ValidationError as PydanticValidationError
-
-    if isinstance(error, PydanticValidationError):
+    if _PydanticValidationError is not None and isinstance(error, _PydanticValidationError):
         errors = error.errors()
         return ErrorResponse(
             error_code="PYDANTIC_VALIDATION_ERROR",
             message=f"Validation failed: {len(errors)} error(s)",
             details={"errors": errors},
-            recovery_strategy="Check the error details and provide valid input according to the schema.",
+            recovery_strategy=_PYDANTIC_RECOVERY,
         )
 
     # Generic exceptions - wrap with minimal structure
@@ -86,10 +101,37 @@ def map_exception_to_response(error: Exception) -> ErrorResponse:
         error_code="INTERNAL_ERROR",
         message=str(error),
         details={"exception_type": type(error).__name__},
-        recovery_strategy="An unexpected error occurred. Please report this issue if it persists.",
+        recovery_strategy=_INTERNAL_RECOVERY,
     )
 
 
+_ERROR_STATUS = sys.intern("error")
+
+
+def _build_mcp(response: ErrorResponse) -> Dict[str, Any]:
+    """Flat MCP error payload; the one construction path for map_error_for_mcp."""
+    return {
+        "status": _ERROR_STATUS,
+        "error_code": response.error_code,
+        "message": response.message,
+        "details": response.details,
+        "recovery_strategy": response.recovery_strategy,
+    }
+
+
+def _build_web(response: ErrorResponse) -> Dict[str, Any]:
+    """Nested web error payload; the one construction path for map_error_for_web."""
+    return {
+        "status": _ERROR_STATUS,
+        "error": {
+            "code": response.error_code,
+            "message": response.message,
+            "details": response.details,
+            "recovery": response.recovery_strategy,
+        },
+    }
+
+
 def map_error_for_mcp(error: Exception) -> Dict[str, Any]:
     """Map exception to MCP tool response format.
 
@@ -99,15 +141,7 @@ def map_error_for_mcp(error: Exception) -> Dict[str, Any]:
     Returns:
         Dictionary suitable for MCP tool response
     """
-    response = map_exception_to_response(error)
-
-    return {
-        "status": "error",
-        "error_code": response.error_code,
-        "message": response.message,
-        "details": response.details,
-        "recovery_strategy": response.recovery_strategy,
-    }
+    return _build_mcp(map_exception_to_response(error))
 
 
 def map_error_for_web(error: Exception, status_code: int = 400) -> Dict[str, Any]:
@@ -120,17 +154,17 @@ def map_error_for_web(error: Exception, status_code: int = 400) -> Dict[str, Any
     Returns:
         Dictionary suitable for FastAPI JSONResponse
     """
-    response = map_exception_to_response(error)
+    return _build_web(map_exception_to_response(error))
 
-    return {
-        "status": "error",
-        "error": {
-            "code": response.error_code,
-            "message": response.message,
-            "details": response.details,
-            "recovery": response.recovery_strategy,
-        },
-    }
+
+# HTTP status per exception class; get_http_status_for_error walks the MRO so the
+# most specific registered ancestor wins.
+_STATUS_BY_TYPE: Dict[type, int] = {
+    ResourceNotFoundError: 404,
+    SecurityError: 403,
+    ValidationError: 400,
+    GofrNpError: 400,
+}
 
 
 def get_http_status_for_error(error: Exception) -> int:
@@ -142,13 +176,8 @@ def get_http_status_for_error(error: Exception) -> int:
     Returns:
         HTTP status code
     """
-    if isinstance(error, ResourceNotFoundError):
-        return 404
-    elif isinstance(error, SecurityError):
-        return 403
-    elif isinstance(error, ValidationError):
-        return 400
-    elif isinstance(error, GofrNpError):
-        return 400
-    else:
-        return 500
+    for error_type in type(error).__mro__:
+        status = _STATUS_BY_TYPE.get(error_type)
+        if status is not None:
+            return status
+    return 500
@@ -4,6 +4,7 @@ Base exceptions (GofrError, ValidationError, etc.) are provided by gofr_common.
 This module contains only GOFRNP-specific exceptions.
 """
 
+import sys
 from typing import Dict, Optional, Any
 
 # Import base from gofr_common
@@ -14,8 +15,13 @@ GofrNpError = GofrError
 
 
 class MathError(GofrError):
-    """Base for all math engine errors."""
-    pass
+    """Base for all math engine errors.
+
+    Error codes are interned so they share storage with the interned
+    RECOVERY_STRATEGIES keys in app.errors.mapper.
+    """
+    def __init__(self, code: str, message: str, details: Optional[Dict[str, Any]] = None):
+        super().__init__(code=sys.intern(code), message=message, details=details)
 
 
 class InvalidInputError(MathError):
@@ -22,23 +22,41 @@ from gofr_common.logger import Logger
 from .default_logger import DefaultLogger
 from .console_logger import ConsoleLogger
 from .structured_logger import StructuredLogger
+import functools
 import logging
 import os
+from typing import TYPE_CHECKING
 
-# Configuration from environment
-LOG_LEVEL_STR = os.environ.get("GOFRNP_LOG_LEVEL", "INFO").upper()
-LOG_FILE = os.environ.get("GOFRNP_LOG_FILE")
-LOG_JSON = os.environ.get("GOFRNP_LOG_JSON", "false").lower() == "true"
+if TYPE_CHECKING:
+    session_logger: Logger
 
-# Map string level to logging constant
-LOG_LEVEL = getattr(logging, LOG_LEVEL_STR, logging.INFO)
 
-# Shared logger instance
-session_logger: Logger = StructuredLogger(
-    level=LOG_LEVEL,
-    log_file=LOG_FILE,
-    json_format=LOG_JSON
-)
+@functools.cache
+def _build_session_logger() -> Logger:
+    """Build the shared logger from GOFRNP_LOG_* (read once, on first use)."""
+    level_name = os.environ.get("GOFRNP_LOG_LEVEL")
+    level = getattr(logging, level_name.upper(), logging.INFO) if level_name else logging.INFO
+    json_flag = os.environ.get("GOFRNP_LOG_JSON")
+    # GOFRNP_LOG_BUFFER_SIZE > 0 batches stdout writes; the server entry
+    # points opt in, everything else flushes per record
+    try:
+        buffer_size = int(os.environ.get("GOFRNP_LOG_BUFFER_SIZE", "0"))
+    except ValueError:
+        buffer_size = 0
+    return StructuredLogger(
+        level=level,
+        log_file=os.environ.get("GOFRNP_LOG_FILE"),
+        json_format=json_flag is not None and json_flag.lower() == "true",
+        buffer_size=buffer_size,
+    )
+
+
+def __getattr__(name: str) -> Logger:
+    # PEP 562: the shared session_logger is created lazily on first access.
+    if name == "session_logger":
+        return _build_session_logger()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "Logger",
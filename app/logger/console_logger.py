@@ -1,8 +1,10 @@
 import logging as python_logging
-import uuid
+import secrets
 from typing import Any
 from gofr_common.logger import Logger
 
+from .structured_logger import register_session_id
+
 
 class ConsoleLogger(Logger):
     """
@@ -24,9 +26,10 @@ class ConsoleLogger(Logger):
             level: Logging level (logging.DEBUG, logging.INFO, etc.)
             format_string: Log format string (must include %(session_id)s)
         """
-        self._session_id = str(uuid.uuid4())[:8]
+        self._session_id = secrets.token_hex(4)
         self._logger = python_logging.getLogger(name)
         self._logger.setLevel(level)
+        register_session_id(name, self._session_id)
 
         # Only add handler if none exist (avoid duplicate handlers)
         if not self._logger.handlers:
@@ -49,24 +52,24 @@ class ConsoleLogger(Logger):
     def debug(self, message: str, **kwargs: Any) -> None:
         """Log a debug message"""
         extra_msg = self._format_extra(**kwargs)
-        self._logger.debug(message + extra_msg, extra={"session_id": self._session_id})
+        self._logger.debug("%s%s", message, extra_msg)
 
     def info(self, message: str, **kwargs: Any) -> None:
         """Log an info message"""
         extra_msg = self._format_extra(**kwargs)
-        self._logger.info(message + extra_msg, extra={"session_id": self._session_id})
+        self._logger.info("%s%s", message, extra_msg)
 
     def warning(self, message: str, **kwargs: Any) -> None:
         """Log a warning message"""
         extra_msg = self._format_extra(**kwargs)
-        self._logger.warning(message + extra_msg, extra={"session_id": self._session_id})
+        self._logger.warning("%s%s", message, extra_msg)
 
     def error(self, message: str, **kwargs: Any) -> None:
         """Log an error message"""
         extra_msg = self._format_extra(**kwargs)
-        self._logger.error(message + extra_msg, extra={"session_id": self._session_id})
+        self._logger.error("%s%s", message, extra_msg)
 
     def critical(self, message: str, **kwargs: Any) -> None:
         """Log a critical message"""
         extra_msg = self._format_extra(**kwargs)
-        self._logger.critical(message + extra_msg, extra={"session_id": self._session_id})
+        self._logger.critical("%s%s", message, extra_msg)
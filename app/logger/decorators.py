@@ -1,10 +1,28 @@
 import functools
+import logging
+import reprlib
 import time
 from typing import Any, Callable, TypeVar, cast
 from app.logger import session_logger
 
 F = TypeVar("F", bound=Callable[..., Any])
 
+# Bounded repr for logged arguments: stops formatting once the budget is spent,
+# so large arrays/lists are never fully stringified just to be truncated.
+_arg_repr = reprlib.Repr()
+_arg_repr.maxstring = 1000
+_arg_repr.maxother = 1000
+_arg_repr.maxlist = 20
+_arg_repr.maxtuple = 20
+_arg_repr.maxarray = 20
+_arg_repr.maxdict = 20
+
+
+def _is_enabled_for(level: int) -> bool:
+    check = getattr(session_logger, "is_enabled_for", None)
+    return check(level) if check is not None else True
+
+
 def log_execution_time(func: F) -> F:
     """Decorator to log execution time and arguments of a function.
     
@@ -12,46 +30,54 @@ def log_execution_time(func: F) -> F:
     - Start of execution with arguments (truncated if too large)
     - End of execution with duration
     - Exceptions if they occur
+
+    If the session logger is above INFO when the function is decorated (the
+    level comes from GOFRNP_LOG_LEVEL at import), a lean wrapper is returned
+    that only logs failures - no argument formatting and no timing.
     """
+    func_name = func.__name__
+
+    if not _is_enabled_for(logging.INFO):
+        @functools.wraps(func)
+        def quiet_wrapper(*args: Any, **kwargs: Any) -> Any:
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                session_logger.error(
+                    "Failed %s", func_name,
+                    error=str(e),
+                    error_type=type(e).__name__,
+                    success=False
+                )
+                raise
+
+        return cast(F, quiet_wrapper)
+
     @functools.wraps(func)
     def wrapper(*args: Any, **kwargs: Any) -> Any:
-        func_name = func.__name__
-        
-        # Sanitize/Truncate args for logging
-        safe_args = []
-        for arg in args:
-            s_arg = str(arg)
-            if len(s_arg) > 1000:
-                safe_args.append(s_arg[:1000] + "...(truncated)")
-            else:
-                safe_args.append(s_arg)
-                
-        safe_kwargs = {}
-        for k, v in kwargs.items():
-            s_v = str(v)
-            if len(s_v) > 1000:
-                safe_kwargs[k] = s_v[:1000] + "...(truncated)"
-            else:
-                safe_kwargs[k] = s_v
-
-        session_logger.debug(f"Starting {func_name}", args=safe_args, kwargs=safe_kwargs)
+        # Sanitize/Truncate args for logging (only when the record will be emitted)
+        if _is_enabled_for(logging.DEBUG):
+            safe_args = [_arg_repr.repr(arg) for arg in args]
+            safe_kwargs = {k: _arg_repr.repr(v) for k, v in kwargs.items()}
+            session_logger.debug("Starting %s", func_name, args=safe_args, kwargs=safe_kwargs)
         
-        start_time = time.perf_counter()
+        start_ns = time.perf_counter_ns()
         try:
             result = func(*args, **kwargs)
-            duration = time.perf_counter() - start_time
-            
-            session_logger.info(
-                f"Completed {func_name}", 
-                duration_seconds=round(duration, 4),
-                success=True
-            )
+            duration_ns = time.perf_counter_ns() - start_ns
+
+            if _is_enabled_for(logging.INFO):
+                session_logger.info(
+                    "Completed %s", func_name,
+                    duration_ns=duration_ns,
+                    success=True
+                )
             return result
         except Exception as e:
-            duration = time.perf_counter() - start_time
+            duration_ns = time.perf_counter_ns() - start_ns
             session_logger.error(
-                f"Failed {func_name}",
-                duration_seconds=round(duration, 4),
+                "Failed %s", func_name,
+                duration_ns=duration_ns,
                 error=str(e),
                 error_type=type(e).__name__,
                 success=False
@@ -1,43 +1,173 @@
+import atexit
 import logging
+import logging.handlers
 import json
+import queue
 import sys
-import uuid
-from typing import Any, Optional
-from datetime import datetime
+import threading
+import secrets
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from datetime import datetime, timezone
 from gofr_common.logger import Logger
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is a declared dependency
+    orjson = None  # type: ignore[assignment]
+
+# Standard LogRecord attributes; anything else on a record came in via extra
+_RESERVED_LOG_ATTRS: frozenset = frozenset({
+    "args", "asctime", "created", "exc_info", "exc_text", "filename",
+    "funcName", "levelname", "levelno", "lineno", "module",
+    "msecs", "message", "msg", "name", "pathname", "process",
+    "processName", "relativeCreated", "stack_info", "thread",
+    "threadName",
+})
+
+# Formatters emit session_id explicitly, so it is skipped with the rest
+_SKIP_WITH_SESSION: frozenset = _RESERVED_LOG_ATTRS | {"session_id", "_has_extras"}
+
+# Set by StructuredLogger on every record: True when it carries caller
+# kwargs, False when it does not. Formatters skip the extras scan only on an
+# explicit False; records from plain logging calls have no marker and are
+# scanned as usual.
+_HAS_EXTRAS = "_has_extras"
+_NO_EXTRAS: Dict[str, Any] = {_HAS_EXTRAS: False}
+
+# session_id is owned by the record factory, so a caller-supplied value is
+# renamed like the other reserved keys instead of clobbering it
+_RESERVED_KWARGS: frozenset = _SKIP_WITH_SESSION
+
+# One background file writer per logger name, so re-initialising a logger
+# stops the previous listener instead of leaking its thread
+_FILE_LISTENERS: Dict[str, logging.handlers.QueueListener] = {}
+
+
+def _stop_file_listener(name: str) -> None:
+    listener = _FILE_LISTENERS.pop(name, None)
+    if listener is not None:
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+
+
+def _stop_all_file_listeners() -> None:
+    for name in list(_FILE_LISTENERS):
+        _stop_file_listener(name)
+
+
+atexit.register(_stop_all_file_listeners)
+
+# session_id per logger name, stamped onto each LogRecord by the factory
+# below rather than passed through extra= on every call
+_SESSION_IDS: Dict[str, str] = {}
+_factory_lock = threading.Lock()
+_factory_installed = False
+
+
+def register_session_id(name: str, session_id: str) -> None:
+    """Stamp session_id on every record created by the named logger."""
+    global _factory_installed
+    _SESSION_IDS[name] = session_id
+    if _factory_installed:
+        return
+    with _factory_lock:
+        if _factory_installed:
+            return
+        previous = logging.getLogRecordFactory()
+
+        def factory(*args: Any, **kwargs: Any) -> logging.LogRecord:
+            record = previous(*args, **kwargs)
+            session_id = _SESSION_IDS.get(record.name)
+            if session_id is not None:
+                record.session_id = session_id
+            return record
+
+        logging.setLogRecordFactory(factory)
+        _factory_installed = True
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat().replace("+00:00", "Z")
+    return str(value)
+
+
+if orjson is not None:
+    _ORJSON_OPTS = orjson.OPT_UTC_Z | orjson.OPT_NAIVE_UTC
+    _ORJSON_NDJSON_OPTS = _ORJSON_OPTS | orjson.OPT_APPEND_NEWLINE
+
+
+def _dumps(data: dict, newline: bool = False) -> str:
+    """Serialize a log record dict; orjson when available, stdlib json otherwise."""
+    if orjson is not None:
+        opts = _ORJSON_NDJSON_OPTS if newline else _ORJSON_OPTS
+        return orjson.dumps(data, default=str, option=opts).decode("utf-8")
+    text = json.dumps(data, default=_json_default)
+    return text + "\n" if newline else text
+
+
 class JsonFormatter(logging.Formatter):
     """JSON formatter for logging records"""
-    
+
+    def __init__(self, *args: Any, append_newline: bool = False, **kwargs: Any):
+        """
+        Args:
+            append_newline: Emit NDJSON lines with the newline written by the
+                serializer; pair with handler.terminator = ""
+        """
+        super().__init__(*args, **kwargs)
+        self._newline = append_newline
+        # Per-thread scratch dict for plain records, see _format_plain
+        self._local = threading.local()
+
+    def _format_plain(self, record: logging.LogRecord, session_id: Any) -> str:
+        """Serialize a record with no extras by refilling a reused dict."""
+        log_data = getattr(self._local, "log_data", None)
+        if log_data is None:
+            log_data = self._local.log_data = dict.fromkeys(
+                ("timestamp", "level", "message", "logger", "session_id")
+            )
+        log_data["timestamp"] = datetime.fromtimestamp(record.created, tz=timezone.utc)
+        log_data["level"] = record.levelname
+        log_data["message"] = record.getMessage()
+        log_data["logger"] = record.name
+        log_data["session_id"] = str(session_id)
+        try:
+            return _dumps(log_data, self._newline)
+        finally:
+            # Do not keep the last message alive between records
+            log_data["message"] = None
+
     def format(self, record: logging.LogRecord) -> str:
+        # Use getattr to avoid static type checking errors since session_id is dynamically added
+        session_id = getattr(record, "session_id", None)
+        if session_id and getattr(record, _HAS_EXTRAS, None) is False:
+            return self._format_plain(record, session_id)
+
         log_data = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            # record.created is stamped once by logging; orjson renders it in C
+            "timestamp": datetime.fromtimestamp(record.created, tz=timezone.utc),
             "level": record.levelname,
             "message": record.getMessage(),
             "logger": record.name,
         }
         
         # Add session_id if present
-        # Use getattr to avoid static type checking errors since session_id is dynamically added
-        session_id = getattr(record, "session_id", None)
         if session_id:
             log_data["session_id"] = str(session_id)
             
         # Add any other attributes that are not standard LogRecord attributes
-        # This handles the extra kwargs passed to the logger
-        skip_keys = {
-            "args", "asctime", "created", "exc_info", "exc_text", "filename", 
-            "funcName", "levelname", "levelno", "lineno", "module", 
-            "msecs", "message", "msg", "name", "pathname", "process", 
-            "processName", "relativeCreated", "stack_info", "thread", 
-            "threadName", "session_id"
-        }
-        
-        for key, value in record.__dict__.items():
-            if key not in skip_keys:
-                log_data[key] = value
+        # This handles the extra kwargs passed to the logger. The set
+        # difference runs in C; the walk below only keeps call order.
+        if getattr(record, _HAS_EXTRAS, None) is False:
+            return _dumps(log_data, self._newline)
+        attrs = record.__dict__
+        extra_keys = attrs.keys() - _SKIP_WITH_SESSION
+        if extra_keys:
+            log_data.update((k, v) for k, v in attrs.items() if k in extra_keys)
 
-        return json.dumps(log_data)
+        return _dumps(log_data, self._newline)
 
 class TextFormatter(logging.Formatter):
     """Text formatter that appends extra kwargs to the message"""
@@ -47,24 +177,126 @@ class TextFormatter(logging.Formatter):
         s = super().format(record)
         
         # Extract and append extra fields
-        skip_keys = {
-            "args", "asctime", "created", "exc_info", "exc_text", "filename", 
-            "funcName", "levelname", "levelno", "lineno", "module", 
-            "msecs", "message", "msg", "name", "pathname", "process", 
-            "processName", "relativeCreated", "stack_info", "thread", 
-            "threadName", "session_id"
-        }
-        
-        extra_args = {}
-        for key, value in record.__dict__.items():
-            if key not in skip_keys:
-                extra_args[key] = value
-                
-        if extra_args:
-            s += " " + " ".join(f"{k}={v}" for k, v in extra_args.items())
-            
+        if getattr(record, _HAS_EXTRAS, None) is False:
+            return s
+        attrs = record.__dict__
+        extra_keys = attrs.keys() - _SKIP_WITH_SESSION
+        if extra_keys:
+            s += " " + " ".join(f"{k}={v}" for k, v in attrs.items() if k in extra_keys)
+
         return s
 
+def _safe_extra(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Turn logger kwargs into a logging extra= mapping.
+
+    session_id is stamped by the record factory (see register_session_id).
+    kwargs is already a fresh dict, so it is passed straight through unless
+    it collides with a reserved LogRecord attribute; reserved keys are
+    prefixed to preserve them but avoid "Attempt to overwrite" errors.
+    Results are tagged with _has_extras for the formatters; empty kwargs
+    give the shared _NO_EXTRAS mapping (logging copies extra onto the record).
+    """
+    if not kwargs:
+        return _NO_EXTRAS
+    if kwargs.keys() & _RESERVED_KWARGS:
+        kwargs = {(f"_{k}" if k in _RESERVED_KWARGS else k): v for k, v in kwargs.items()}
+    kwargs[_HAS_EXTRAS] = True
+    return kwargs
+
+
+class BufferedStreamHandler(logging.StreamHandler):
+    """
+    StreamHandler that batches records instead of flushing after each one.
+
+    Formatted records accumulate in memory and are written in one call when
+    buffer_size characters are pending, when a record at flush_level or above
+    arrives, or when the background flusher wakes every flush_interval seconds.
+    logging.shutdown() flushes whatever is left at exit.
+    """
+
+    def __init__(
+        self,
+        stream: Any = None,
+        buffer_size: int = 8192,
+        flush_interval: float = 0.1,
+        flush_level: int = logging.WARNING,
+    ):
+        super().__init__(stream)
+        self._buffer_size = buffer_size
+        self._flush_level = flush_level
+        self._pending: List[str] = []
+        self._pending_size = 0
+        self._stop = threading.Event()
+        self._flusher = threading.Thread(
+            target=self._flush_loop, args=(flush_interval,), name="log-flush", daemon=True
+        )
+        self._flusher.start()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            msg = self.format(record) + self.terminator
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+            return
+        # handle() already holds self.lock here
+        self._pending.append(msg)
+        self._pending_size += len(msg)
+        if self._pending_size >= self._buffer_size or record.levelno >= self._flush_level:
+            self.flush()
+
+    def flush(self) -> None:
+        with self.lock:
+            if self._pending:
+                data = "".join(self._pending)
+                self._pending.clear()
+                self._pending_size = 0
+                self.stream.write(data)
+            super().flush()
+
+    def _flush_loop(self, interval: float) -> None:
+        while not self._stop.wait(interval):
+            self.flush()
+
+    def close(self) -> None:
+        self._stop.set()
+        self.flush()
+        super().close()
+
+
+class ContextLogger(logging.LoggerAdapter):
+    """
+    LoggerAdapter that binds structured context to every record.
+
+    Accepts the same keyword style as StructuredLogger (arbitrary kwargs
+    become fields) alongside the usual exc_info/stack_info/stacklevel.
+    Calls without kwargs reuse the extra dict prepared at construction.
+    """
+
+    _LOGGING_KWARGS = frozenset({"exc_info", "stack_info", "stacklevel"})
+
+    def __init__(self, logger: logging.Logger, context: Dict[str, Any]):
+        super().__init__(logger, context)
+        self._prepared = _safe_extra(dict(context))
+
+    def process(self, msg: Any, kwargs: Any) -> Any:
+        if not kwargs:
+            return msg, {"extra": self._prepared}
+        fields = dict(self.extra or {})
+        passthrough = {}
+        for key, value in kwargs.items():
+            if key in self._LOGGING_KWARGS:
+                passthrough[key] = value
+            elif key == "extra":
+                fields.update(value or {})
+            else:
+                fields[key] = value
+        passthrough["extra"] = _safe_extra(fields)
+        return msg, passthrough
+
+
 class StructuredLogger(Logger):
     """
     Logger implementation that supports structured JSON logging and file output.
@@ -76,76 +308,158 @@ class StructuredLogger(Logger):
         level: int = logging.INFO,
         log_file: Optional[str] = None,
         json_format: bool = False,
+        buffer_size: int = 0,
     ):
-        self._session_id = str(uuid.uuid4())[:8]
+        self._session_id = secrets.token_hex(4)
         self._logger = logging.getLogger(name)
         self._logger.setLevel(level)
+        register_session_id(name, self._session_id)
+        if type(self) is StructuredLogger:
+            self._bind_level_methods()
         
         # Clear existing handlers to avoid duplication if re-initialized
         if self._logger.hasHandlers():
+            for handler in self._logger.handlers:
+                handler.close()
             self._logger.handlers.clear()
+        _stop_file_listener(name)
             
         self._logger.propagate = False
 
         # Create formatter
         if json_format:
-            formatter = JsonFormatter()
+            formatter = JsonFormatter(append_newline=True)
         else:
             # Standard format string
             formatter = TextFormatter(
                 "%(asctime)s [%(levelname)s] [session:%(session_id)s] %(message)s"
             )
 
-        # Console Handler (stdout)
-        console_handler = logging.StreamHandler(sys.stdout)
+        # Console Handler (stdout), batched when a buffer size is given
+        console_handler: logging.StreamHandler
+        if buffer_size > 0:
+            console_handler = BufferedStreamHandler(sys.stdout, buffer_size=buffer_size)
+        else:
+            console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setFormatter(formatter)
+        if json_format:
+            # The formatter already ends each record with a newline
+            console_handler.terminator = ""
         self._logger.addHandler(console_handler)
 
-        # File Handler (if configured)
+        # File Handler (if configured). Writes happen on a QueueListener
+        # thread so callers never block on disk I/O.
         if log_file:
             try:
                 file_handler = logging.FileHandler(log_file)
                 file_handler.setFormatter(formatter)
-                self._logger.addHandler(file_handler)
+                if json_format:
+                    file_handler.terminator = ""
+                log_queue: queue.SimpleQueue = queue.SimpleQueue()
+                listener = logging.handlers.QueueListener(
+                    log_queue, file_handler, respect_handler_level=True
+                )
+                listener.start()
+                _FILE_LISTENERS[name] = listener
+                self._logger.addHandler(logging.handlers.QueueHandler(log_queue))
             except Exception as e:
                 # Fallback to console if file cannot be opened
                 print(f"Failed to setup log file {log_file}: {e}", file=sys.stderr)
 
+    def close(self) -> None:
+        """Flush and stop the background file writer, if any."""
+        _stop_file_listener(self._logger.name)
+
+    def flush(self) -> None:
+        """Write out records held by a buffered console handler."""
+        for handler in self._logger.handlers:
+            handler.flush()
+
     def get_session_id(self) -> str:
         return self._session_id
 
-    def _log(self, level: int, message: str, **kwargs: Any) -> None:
-        extra = {"session_id": self._session_id}
-        
-        # Filter out reserved LogRecord attributes from kwargs to prevent "Attempt to overwrite" errors
-        reserved_keys = {
-            "args", "asctime", "created", "exc_info", "exc_text", "filename", 
-            "funcName", "levelname", "levelno", "lineno", "module", 
-            "msecs", "message", "msg", "name", "pathname", "process", 
-            "processName", "relativeCreated", "stack_info", "thread", 
-            "threadName"
-        }
-        
-        for k, v in kwargs.items():
-            if k not in reserved_keys:
-                extra[k] = v
-            else:
-                # If a reserved key is passed, prefix it to preserve it but avoid collision
-                extra[f"_{k}"] = v
-                
-        self._logger.log(level, message, extra=extra)
+    def is_enabled_for(self, level: int) -> bool:
+        """Return True if a record at this level would be emitted."""
+        return self._logger.isEnabledFor(level)
+
+    def log_many(self, level: int, events: Iterable[Tuple[str, Dict[str, Any]]]) -> None:
+        """
+        Emit several records at one level with a single level check.
+
+        Records are built with makeRecord and passed straight to handle(),
+        skipping the per-call stack walk logging does to find the caller.
+
+        Args:
+            level: Logging level shared by all events
+            events: (message, fields) pairs; fields may be empty
+        """
+        logger = self._logger
+        if not logger.isEnabledFor(level):
+            return
+        name = logger.name
+        for message, fields in events:
+            extra = _safe_extra(dict(fields)) if fields else _NO_EXTRAS
+            logger.handle(
+                logger.makeRecord(name, level, "(unknown file)", 0, message, (), None, extra=extra)
+            )
+
+    def with_context(self, **context: Any) -> ContextLogger:
+        """
+        Return a sub-logger that adds context fields to every record.
+
+        The sub-logger shares this logger's handlers and session_id, so
+        per-request loggers cost one small object rather than a new handler
+        stack.
+
+        Args:
+            **context: Fields attached to every record, e.g. request_id
+
+        Returns:
+            ContextLogger bound to the underlying logging.Logger
+        """
+        return ContextLogger(self._logger, context)
+
+    def _log(self, level: int, message: str, *args: Any, **kwargs: Any) -> None:
+        # Bail out before building extra when the record would be dropped
+        if not self._logger.isEnabledFor(level):
+            return
+
+        self._logger.log(level, message, *args, extra=_safe_extra(kwargs))
+
+    def _bind_level_methods(self) -> None:
+        """
+        Shadow debug/info/... with per-instance closures.
+
+        Each closure does the level check and hands off to logging directly,
+        saving the extra frame and kwargs repack of going through _log. The
+        class methods remain for the Logger ABC and are what subclasses get.
+        """
+        logger = self._logger
+
+        def bind(level: int) -> Callable[..., None]:
+            def log_at_level(message: str, *args: Any, **kwargs: Any) -> None:
+                if logger.isEnabledFor(level):
+                    logger.log(level, message, *args, extra=_safe_extra(kwargs))
+
+            return log_at_level
+
+        self.debug = bind(logging.DEBUG)  # type: ignore[method-assign]
+        self.info = bind(logging.INFO)  # type: ignore[method-assign]
+        self.warning = bind(logging.WARNING)  # type: ignore[method-assign]
+        self.error = bind(logging.ERROR)  # type: ignore[method-assign]
+        self.critical = bind(logging.CRITICAL)  # type: ignore[method-assign]
 
-    def debug(self, message: str, **kwargs: Any) -> None:
-        self._log(logging.DEBUG, message, **kwargs)
+    def debug(self, message: str, *args: Any, **kwargs: Any) -> None:
+        self._log(logging.DEBUG, message, *args, **kwargs)
 
-    def info(self, message: str, **kwargs: Any) -> None:
-        self._log(logging.INFO, message, **kwargs)
+    def info(self, message: str, *args: Any, **kwargs: Any) -> None:
+        self._log(logging.INFO, message, *args, **kwargs)
 
-    def warning(self, message: str, **kwargs: Any) -> None:
-        self._log(logging.WARNING, message, **kwargs)
+    def warning(self, message: str, *args: Any, **kwargs: Any) -> None:
+        self._log(logging.WARNING, message, *args, **kwargs)
 
-    def error(self, message: str, **kwargs: Any) -> None:
-        self._log(logging.ERROR, message, **kwargs)
+    def error(self, message: str, *args: Any, **kwargs: Any) -> None:
+        self._log(logging.ERROR, message, *args, **kwargs)
 
-    def critical(self, message: str, **kwargs: Any) -> None:
-        self._log(logging.CRITICAL, message, **kwargs)
+    def critical(self, message: str, *args: Any, **kwargs: Any) -> None:
+        self._log(logging.CRITICAL, message, *args, **kwargs)
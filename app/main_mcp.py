@@ -1,10 +1,13 @@
 import argparse
 import os
 import sys
-import asyncio
+
+# Batch console log writes in the server; must precede the session_logger import
+os.environ.setdefault("GOFRNP_LOG_BUFFER_SIZE", "8192")
+
 from app.logger import Logger, session_logger
 import app.startup.validation
-from app.auth import create_auth_service, is_auth_disabled
+from app.startup.cli import common_parser
 
 logger: Logger = session_logger
 
@@ -18,36 +21,8 @@ if __name__ == "__main__":
 
     # Parse command line arguments
     parser = argparse.ArgumentParser(
-        description="GOFRNP MCP Server - NumPy operations via Model Context Protocol"
-    )
-    parser.add_argument(
-        "--host",
-        type=str,
-        default="0.0.0.0",
-        help="Host address to bind to (default: 0.0.0.0)",
-    )
-    parser.add_argument(
-        "--port",
-        type=int,
-        default=int(os.environ.get("GOFRNP_MCP_PORT", "8020")),
-        help="Port number to listen on (default: 8020, or GOFRNP_MCP_PORT env var)",
-    )
-    parser.add_argument(
-        "--jwt-secret",
-        type=str,
-        default=None,
-        help="DEPRECATED: JWT secret is sourced from Vault via gofr-common (ignored)",
-    )
-    parser.add_argument(
-        "--token-store",
-        type=str,
-        default=None,
-        help="DEPRECATED: token store is Vault-backed via gofr-common (ignored)",
-    )
-    parser.add_argument(
-        "--no-auth",
-        action="store_true",
-        help="Disable authentication (WARNING: insecure, for development only)",
+        description="GOFRNP MCP Server - NumPy operations via Model Context Protocol",
+        parents=[common_parser("GOFRNP_MCP_PORT", 8020)],
     )
     parser.add_argument(
         "--templates-dir",
@@ -76,6 +51,16 @@ if __name__ == "__main__":
     )
     args = parser.parse_args()
 
+    try:
+        app.startup.validation.validate_log_file(os.environ.get("GOFRNP_LOG_FILE"))
+    except RuntimeError as e:
+        logger.error("FATAL: Log file validation failed", error=str(e))
+        sys.exit(1)
+
+    # Heavy imports are deferred so --help and argument errors return quickly
+    import asyncio
+    from app.auth import get_auth_service, is_auth_disabled
+
     # Create logger for startup messages
     startup_logger: Logger = session_logger
 
@@ -93,7 +78,7 @@ if __name__ == "__main__":
             jwt_enabled=False,
         )
     else:
-        auth_service = create_auth_service(logger=startup_logger)
+        auth_service = get_auth_service(logger=startup_logger)
         startup_logger.info(
             "Authentication service initialized",
             jwt_enabled=True,
@@ -127,7 +112,7 @@ if __name__ == "__main__":
             styles_dir=args.styles_dir or "(default)",
         )
         startup_logger.info("=" * 70)
-        startup_logger.info(f"MCP endpoint: http://{args.host}:{args.port}/mcp")
+        startup_logger.info("MCP endpoint: http://%s:%d/mcp", args.host, args.port)
         startup_logger.info("=" * 70)
         asyncio.run(main(host=args.host, port=args.port))
         startup_logger.info("=" * 70)
@@ -10,8 +10,11 @@ import os
 import signal
 import sys
 
+# Batch console log writes in the server; must precede the session_logger import
+os.environ.setdefault("GOFRNP_LOG_BUFFER_SIZE", "8192")
+
 from app.logger import Logger, session_logger
-from app.mcpo.wrapper import start_mcpo_wrapper
+import app.startup.validation
 
 logger: Logger = session_logger
 
@@ -80,6 +83,15 @@ if __name__ == "__main__":
 
     args = parser.parse_args()
 
+    try:
+        app.startup.validation.validate_log_file(os.environ.get("GOFRNP_LOG_FILE"))
+    except RuntimeError as e:
+        logger.error("FATAL: Log file validation failed", error=str(e))
+        sys.exit(1)
+
+    # Deferred so --help and argument errors return quickly
+    from app.mcpo.wrapper import start_mcpo_wrapper
+
     # Determine auth mode
     use_auth = False
     if args.auth:
@@ -128,8 +140,8 @@ if __name__ == "__main__":
 
         if wrapper and wrapper.process:
             logger.info("MCPO wrapper started successfully")
-            logger.info(f"OpenAPI endpoint: http://{args.mcpo_host}:{args.mcpo_port}")
-            logger.info(f"Documentation: http://{args.mcpo_host}:{args.mcpo_port}/docs")
+            logger.info("OpenAPI endpoint: http://%s:%d", args.mcpo_host, args.mcpo_port)
+            logger.info("Documentation: http://%s:%d/docs", args.mcpo_host, args.mcpo_port)
             logger.info("=" * 70)
 
             # Wait for process to complete (or be interrupted)
@@ -1,14 +1,15 @@
 """GOFRNP Web Server entry point - Minimal stub implementation."""
 
-import uvicorn
 import argparse
 import os
 import sys
 
-from app.web_server.web_server import GofrNpWebServer
-from app.auth import create_auth_service, is_auth_disabled
+# Batch console log writes in the server; must precede the session_logger import
+os.environ.setdefault("GOFRNP_LOG_BUFFER_SIZE", "8192")
+
 from app.logger import Logger, session_logger
 import app.startup.validation
+from app.startup.cli import common_parser
 
 logger: Logger = session_logger
 
@@ -21,38 +22,23 @@ if __name__ == "__main__":
         sys.exit(1)
 
     # Parse command line arguments
-    parser = argparse.ArgumentParser(description="GOFRNP Web Server - Stub REST API")
-    parser.add_argument(
-        "--host",
-        type=str,
-        default="0.0.0.0",
-        help="Host address to bind to (default: 0.0.0.0)",
-    )
-    parser.add_argument(
-        "--port",
-        type=int,
-        default=int(os.environ.get("GOFRNP_WEB_PORT", "8022")),
-        help="Port number to listen on (default: 8022, or GOFRNP_WEB_PORT env var)",
-    )
-    parser.add_argument(
-        "--jwt-secret",
-        type=str,
-        default=None,
-        help="DEPRECATED: JWT secret is sourced from Vault via gofr-common (ignored)",
-    )
-    parser.add_argument(
-        "--token-store",
-        type=str,
-        default=None,
-        help="DEPRECATED: token store is Vault-backed via gofr-common (ignored)",
-    )
-    parser.add_argument(
-        "--no-auth",
-        action="store_true",
-        help="Disable authentication (WARNING: insecure, for development only)",
+    parser = argparse.ArgumentParser(
+        description="GOFRNP Web Server - Stub REST API",
+        parents=[common_parser("GOFRNP_WEB_PORT", 8022)],
     )
     args = parser.parse_args()
 
+    try:
+        app.startup.validation.validate_log_file(os.environ.get("GOFRNP_LOG_FILE"))
+    except RuntimeError as e:
+        logger.error("FATAL: Log file validation failed", error=str(e))
+        sys.exit(1)
+
+    # Heavy imports are deferred so --help and argument errors return quickly
+    import uvicorn
+    from app.auth import get_auth_service, is_auth_disabled
+    from app.web_server.web_server import GofrNpWebServer
+
     if args.jwt_secret or args.token_store:
         logger.warning(
             "Deprecated auth args provided; ignored (gofr-common Vault auth is used)",
@@ -67,7 +53,7 @@ if __name__ == "__main__":
             jwt_enabled=False,
         )
     else:
-        auth_service = create_auth_service(logger=logger)
+        auth_service = get_auth_service(logger=logger)
         logger.info(
             "Authentication service initialized",
             jwt_enabled=True,
@@ -93,9 +79,9 @@ if __name__ == "__main__":
             jwt_enabled=auth_service is not None,
         )
         logger.info("=" * 70)
-        logger.info(f"API endpoint: http://{args.host}:{args.port}")
-        logger.info(f"Ping: http://{args.host}:{args.port}/ping")
-        logger.info(f"Health check: http://{args.host}:{args.port}/health")
+        logger.info("API endpoint: http://%s:%d", args.host, args.port)
+        logger.info("Ping: http://%s:%d/ping", args.host, args.port)
+        logger.info("Health check: http://%s:%d/health", args.host, args.port)
         logger.info("=" * 70)
         uvicorn.run(server.app, host=args.host, port=args.port, log_level="info")
         logger.info("=" * 70)
@@ -11,7 +11,7 @@ from dataclasses import dataclass
 from typing import Any, Dict, List, Union
 
 
-@dataclass
+@dataclass(slots=True)
 class MathResult:
     """Result of a math computation."""
 
@@ -28,7 +28,7 @@ class MathResult:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolDefinition:
     """Definition of an MCP tool provided by a capability."""
 
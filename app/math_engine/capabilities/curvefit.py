@@ -1,28 +1,235 @@
 """Curve Fitting Capability.
 
-Provides robust curve fitting and model selection using NumPy and TensorFlow.
+Provides robust curve fitting and model selection using NumPy and SciPy.
 Automatically selects the best model complexity and handles outliers.
 """
 
 from __future__ import annotations
 
-import os
+import hashlib
+from collections import OrderedDict
 from typing import Any, Dict, List, Optional, Tuple, Union, Callable
 from dataclasses import dataclass
 
-# Suppress TensorFlow logging
-os.environ.setdefault("TF_CPP_MIN_LOG_LEVEL", "2")
+import numpy as np
+from scipy.optimize import curve_fit
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - numba is an optional extra
+    njit = None
+
+from app.logger import session_logger as logger
+from app.logger.decorators import log_execution_time
+from app.math_engine.base import MathCapability, MathResult, ToolDefinition
+from app.exceptions import InvalidInputError
+
+
+def _sse_sst_numpy(y_true: np.ndarray, y_pred: np.ndarray) -> Tuple[float, float]:
+    residuals = y_true - y_pred
+    return float(np.sum(residuals**2)), float(np.sum((y_true - np.mean(y_true))**2))
+
+
+if njit is not None:
+    # Explicit signatures compile eagerly at import (loading from the on-disk
+    # cache after the first run), so the first fit does not pay for the JIT.
+    # Callers must pass C-contiguous float64 arrays.
+    @njit("UniTuple(float64, 2)(float64[::1], float64[::1])", cache=True, fastmath=True)
+    def _sse_sst(y_true, y_pred):  # pragma: no cover - compiled
+        """Sum of squared residuals and total sum of squares in one fused pass."""
+        n = y_true.shape[0]
+        mean = 0.0
+        for i in range(n):
+            mean += y_true[i]
+        mean /= n
+        sse = 0.0
+        sst = 0.0
+        for i in range(n):
+            r = y_true[i] - y_pred[i]
+            sse += r * r
+            d = y_true[i] - mean
+            sst += d * d
+        return sse, sst
+
+    @njit("void(float64[::1], float64[::1], float64[::1])", cache=True, fastmath=True)
+    def _horner(coeffs, x, out):  # pragma: no cover - compiled
+        """Evaluate a polynomial (highest power first) at every x; out may alias x."""
+        for i in range(x.shape[0]):
+            xi = x[i]
+            acc = coeffs[0]
+            for j in range(1, coeffs.shape[0]):
+                acc = acc * xi + coeffs[j]
+            out[i] = acc
+
+    @njit("UniTuple(float64, 2)(float64[::1])", cache=True, fastmath=True)
+    def _min_max(values):  # pragma: no cover - compiled
+        """Minimum and maximum in a single pass."""
+        lo = values[0]
+        hi = values[0]
+        for i in range(1, values.shape[0]):
+            v = values[i]
+            if v < lo:
+                lo = v
+            elif v > hi:
+                hi = v
+        return lo, hi
+else:
+    _sse_sst = _sse_sst_numpy
+    _horner = None
+
+    def _min_max(values: np.ndarray) -> Tuple[float, float]:
+        return float(np.min(values)), float(np.max(values))
+
+
+def _median(values: np.ndarray) -> float:
+    """Median via a single partial sort (same result as np.median for 1-D input)."""
+    n = values.shape[0]
+    mid = n // 2
+    if n % 2:
+        return float(np.partition(values, mid)[mid])
+    part = np.partition(values, (mid - 1, mid))
+    return float(0.5 * (part[mid - 1] + part[mid]))
+
+
+def _abs_line_residuals_f32(x: np.ndarray, y: np.ndarray) -> Tuple[np.ndarray, float]:
+    """Absolute residuals of the least-squares line through (x, y), in float32.
+
+    The data is centred in float64 and only then narrowed, so large offsets
+    (e.g. timestamps) do not swamp float32 resolution. Also returns the
+    smallest MAD that is distinguishable from float32 rounding noise.
+    """
+    n = x.shape[0]
+    xc = np.empty(n, dtype=np.float32)
+    yc = np.empty(n, dtype=np.float32)
+    np.subtract(x, x.mean(), out=xc, casting="same_kind")
+    np.subtract(y, y.mean(), out=yc, casting="same_kind")
+    sxx = float(np.dot(xc, xc))
+    slope = np.float32(float(np.dot(xc, yc)) / sxx) if sxx > 0 else np.float32(0.0)
+    residuals = np.multiply(xc, slope)
+    np.subtract(yc, residuals, out=residuals)
+    np.abs(residuals, out=residuals)
+    noise_floor = float(np.finfo(np.float32).eps) * float(np.abs(yc).max())
+    return residuals, max(1e-9, noise_floor)
+
+
+def _exp_model(x: np.ndarray, a: float, b: float, c: float) -> np.ndarray:
+    return a * np.exp(b * x) + c
+
+
+def _exp_jac(x: np.ndarray, a: float, b: float, c: float) -> np.ndarray:
+    e = np.exp(b * x)
+    return np.column_stack((e, a * x * e, np.ones_like(x)))
+
+
+def _sigmoid_model(x: np.ndarray, L: float, k: float, x0: float, b: float) -> np.ndarray:
+    return L / (1.0 + np.exp(-k * (x - x0))) + b
+
+
+def _sigmoid_jac(x: np.ndarray, L: float, k: float, x0: float, b: float) -> np.ndarray:
+    s = 1.0 / (1.0 + np.exp(-k * (x - x0)))
+    ds = L * s * (1.0 - s)
+    return np.column_stack((s, ds * (x - x0), -ds * k, np.ones_like(x)))
+
+
+def _predict_poly(x_new: Any, coeffs: np.ndarray) -> np.ndarray:
+    """Polynomial (highest power first) evaluated with the Numba Horner kernel when available."""
+    out = np.array(x_new, dtype=np.float64, order="C")
+    if _horner is None:
+        # Horner in place: one accumulator buffer instead of np.polyval's
+        # two temporaries per coefficient
+        x_arr = out.copy()
+        out.fill(coeffs[0])
+        for c in coeffs[1:]:
+            np.multiply(out, x_arr, out=out)
+            np.add(out, c, out=out)
+        return out
+    flat = out.reshape(-1)
+    _horner(coeffs, flat, flat)
+    return out
+
+
+def _predict_exp(x_new: Any, a: float, b: float, c: float) -> np.ndarray:
+    """a * exp(b * x) + c evaluated in a single buffer (x_new is copied, never mutated)."""
+    out = np.array(x_new, dtype=np.float64)
+    np.multiply(out, b, out=out)
+    np.exp(out, out=out)
+    np.multiply(out, a, out=out)
+    np.add(out, c, out=out)
+    return out
+
+
+def _predict_sigmoid(x_new: Any, L: float, k: float, x0: float, b: float) -> np.ndarray:
+    """L / (1 + exp(-k * (x - x0))) + b evaluated in a single buffer."""
+    out = np.array(x_new, dtype=np.float64)
+    np.subtract(out, x0, out=out)
+    np.multiply(out, -k, out=out)
+    np.exp(out, out=out)
+    np.add(out, 1.0, out=out)
+    np.divide(L, out, out=out)
+    np.add(out, b, out=out)
+    return out
+
+
+def _predict_power(x_new: Any, a: float, b: float) -> np.ndarray:
+    """a * x^b evaluated in a single buffer."""
+    out = np.array(x_new, dtype=np.float64)
+    np.power(out, b, out=out)
+    np.multiply(out, a, out=out)
+    return out
+
+
+def _least_squares(model: Callable, jac: Callable, x: np.ndarray, y: np.ndarray,
+                   p0: List[float]) -> List[float]:
+    """Levenberg-Marquardt fit from p0; falls back to p0 if the fit does not converge.
+
+    LM needs at least as many points as parameters, so underdetermined
+    inputs (e.g. a sigmoid on 3 points) use the trust-region solver instead.
+    """
+    method = "lm" if len(x) >= len(p0) else "trf"
+    try:
+        with np.errstate(over="ignore", invalid="ignore"):
+            popt, _ = curve_fit(model, x, y, p0=p0, jac=jac, method=method, maxfev=200)
+    except (RuntimeError, ValueError, TypeError):
+        return [float(p) for p in p0]
+    if not np.all(np.isfinite(popt)):
+        return [float(p) for p in p0]
+    return [float(p) for p in popt]
+
+
+def _format_poly_eq(coeffs: List[float], degree: int) -> str:
+    """Format polynomial coefficients (highest power first) as an equation."""
+    terms = []
+    for i, c in enumerate(coeffs):
+        power = degree - i
+        if abs(c) < 1e-10:
+            continue
+
+        c_str = f"{c:.4g}"
+        if power == 0:
+            terms.append(c_str)
+        elif power == 1:
+            terms.append(f"{c_str}x")
+        else:
+            terms.append(f"{c_str}x^{power}")
 
-import numpy as np  # noqa: E402
-import tensorflow as tf  # noqa: E402
+    return "y = " + " + ".join(terms).replace("+ -", "- ")
 
-# Disable TensorFlow warnings
-tf.get_logger().setLevel("ERROR")
 
-from app.logger import session_logger as logger  # noqa: E402
-from app.logger.decorators import log_execution_time  # noqa: E402
-from app.math_engine.base import MathCapability, MathResult, ToolDefinition  # noqa: E402
-from app.exceptions import InvalidInputError  # noqa: E402
+def _format_equation(model_type: str, params: List[float]) -> str:
+    """Format the equation string for a fitted model from its parameters."""
+    if model_type == "exponential":
+        a_val, b_val, c_val = params
+        return f"y = {a_val:.4g} * e^({b_val:.4g}x) + {c_val:.4g}"
+    if model_type == "logarithmic":
+        a_val, b_val = params
+        return f"y = {a_val:.4g} + {b_val:.4g} * ln(x)"
+    if model_type == "power":
+        a_val, b_val = params
+        return f"y = {a_val:.4g} * x^{b_val:.4g}"
+    if model_type == "sigmoid":
+        L_val, k_val, x0_val, b_val = params
+        return f"y = {L_val:.4g} / (1 + e^(-{k_val:.4g}(x - {x0_val:.4g}))) + {b_val:.4g}"
+    return _format_poly_eq(params, len(params) - 1)
 
 
 @dataclass
@@ -33,13 +240,25 @@ class FitResult:
     r_squared: float
     rmse: float
     aic: float
-    equation: str
-    predict_fn: Callable[[Union[float, List[float]]], List[float]]
+    predict_fn: Callable[[Union[float, List[float]]], np.ndarray]
+    data_points: int = 0
+    outliers_removed: int = 0
+
+    @property
+    def equation(self) -> str:
+        """Equation string; formatted on demand so rejected candidates never pay for it."""
+        return _format_equation(self.model_type, self.params)
 
 
 class CurveFitCapability(MathCapability):
     """Curve fitting with automatic model selection and validation."""
 
+    # Fitted models kept for curve_predict; least recently used are evicted
+    MAX_FITTED_MODELS = 256
+
+    # Above this many points the outlier scan runs in float32
+    FLOAT32_SCAN_MIN_POINTS = 1024
+
     @property
     def name(self) -> str:
         return "curvefit"
@@ -51,7 +270,7 @@ class CurveFitCapability(MathCapability):
     def __init__(self):
         """Initialize the curve fitting capability."""
         logger.info("CurveFitCapability initialized")
-        self._fitted_models: Dict[str, FitResult] = {}
+        self._fitted_models: "OrderedDict[str, FitResult]" = OrderedDict()
 
     def get_tools(self) -> List[ToolDefinition]:
         """Return tool definitions for curve fitting."""
@@ -168,8 +387,8 @@ class CurveFitCapability(MathCapability):
             raise InvalidInputError("At least 3 data points are required for curve fitting")
 
         # Convert to numpy arrays
-        x = np.array(x_in, dtype=np.float64)
-        y = np.array(y_in, dtype=np.float64)
+        x = np.fromiter(x_in, dtype=np.float64, count=len(x_in))
+        y = np.fromiter(y_in, dtype=np.float64, count=len(y_in))
 
         # Remove NaNs or Infs
         mask = np.isfinite(x) & np.isfinite(y)
@@ -179,19 +398,39 @@ class CurveFitCapability(MathCapability):
             if len(x) < 3:
                 raise InvalidInputError("Too many invalid points (NaN/Inf)")
 
+        # Identical data and settings always give the same fit, so the model id
+        # is a digest of them and a repeated request skips fitting entirely
+        digest = hashlib.blake2b(x, digest_size=8)
+        digest.update(y)
+        digest.update(f"{model_type}:{degree}".encode())
+        model_id = f"fit_{digest.hexdigest()}"
+        cached = self._fitted_models.get(model_id)
+        if cached is not None:
+            self._fitted_models.move_to_end(model_id)
+            return self._fit_response(model_id, cached)
+
         # 1. Outlier Detection (Robust Z-score on residuals of a simple linear fit)
-        # We do a quick linear fit to find obvious outliers
-        p_init = np.polyfit(x, y, 1)
-        y_pred_init = np.polyval(p_init, x)
-        residuals = np.abs(y - y_pred_init)
-        mad = np.median(residuals)
-        if mad > 1e-9:
-            modified_z_score = 0.6745 * residuals / mad
+        # We do a quick linear fit to find obvious outliers. The scan is
+        # memory-bound, so large inputs run it in float32; the 3.5 threshold
+        # does not need more precision. The model fits below stay float64.
+        p_init: Optional[np.ndarray] = None
+        if len(x) > self.FLOAT32_SCAN_MIN_POINTS:
+            residuals, mad_floor = _abs_line_residuals_f32(x, y)
+        else:
+            p_init = np.polyfit(x, y, 1)
+            y_pred_init = np.polyval(p_init, x)
+            residuals = y - y_pred_init
+            np.abs(residuals, out=residuals)
+            mad_floor = 1e-9
+        mad = _median(residuals)
+        if mad > mad_floor:
             # Threshold of 3.5 is standard for modified Z-score
-            clean_mask = modified_z_score < 3.5
+            clean_mask = residuals * (0.6745 / mad) < 3.5
             
-            # Only remove if we still have enough points
-            if np.sum(clean_mask) >= 3:
+            # Only remove if we still have enough points (and only copy if
+            # something is actually removed)
+            n_clean = int(np.count_nonzero(clean_mask))
+            if 3 <= n_clean < len(x):
                 x_clean = x[clean_mask]
                 y_clean = y[clean_mask]
             else:
@@ -209,17 +448,40 @@ class CurveFitCapability(MathCapability):
             max_deg = degree if degree else min(10, len(x_clean) - 2)
             min_deg = degree if degree else 1
             
-            for d in range(min_deg, max_deg + 1):
-                candidates.append(self._fit_polynomial(x_clean, y_clean, d))
+            if min_deg == 1 and max_deg >= 1 and x_clean is x and p_init is not None:
+                # No outliers removed: the stage-1 line is the degree-1 fit
+                candidates.append(self._polynomial_result(y, p_init, y_pred_init, 1))
+                min_deg = 2
+            candidates.extend(self._fit_polynomials(
+                x_clean, y_clean, min_deg, max_deg, early_stop=model_type == "auto"
+            ))
 
         if model_type == "auto" or model_type == "exponential":
             candidates.append(self._fit_exponential(x_clean, y_clean))
             
-        if model_type == "auto" or model_type == "logarithmic":
-            candidates.append(self._fit_logarithmic(x_clean, y_clean))
-            
-        if model_type == "auto" or model_type == "power":
-            candidates.append(self._fit_power(x_clean, y_clean))
+        # ln(x) is shared by the logarithmic and power fits, ln(y) is only
+        # needed by power; either fit is skipped when its logs are undefined
+        log_x_clean: Optional[np.ndarray] = None
+        log_y_clean: Optional[np.ndarray] = None
+        # x and y are finite here, so ln is finite exactly where the input is
+        # positive: take the log first and check the result in one reduction
+        if model_type in ("auto", "logarithmic", "power"):
+            with np.errstate(divide="ignore", invalid="ignore"):
+                log_x = np.log(x_clean)
+                if np.isfinite(log_x).all():
+                    log_x_clean = log_x
+                    if model_type != "logarithmic":
+                        log_y = np.log(y_clean)
+                        if np.isfinite(log_y).all():
+                            log_y_clean = log_y
+
+        if (model_type == "auto" or model_type == "logarithmic") and log_x_clean is not None:
+            candidates.append(self._fit_logarithmic(x_clean, y_clean, log_x_clean))
+            
+        # log_y_clean is only set alongside log_x_clean
+        if (model_type == "auto" or model_type == "power") and log_y_clean is not None:
+            assert log_x_clean is not None
+            candidates.append(self._fit_power(x_clean, y_clean, log_x_clean, log_y_clean))
             
         if model_type == "auto" or model_type == "sigmoid":
             candidates.append(self._fit_sigmoid(x_clean, y_clean))
@@ -234,12 +496,18 @@ class CurveFitCapability(MathCapability):
         # Lower AIC is better
         best_fit = min(valid_candidates, key=lambda c: c.aic)
         assert best_fit is not None
+        best_fit.data_points = len(x_clean)
+        best_fit.outliers_removed = len(x) - len(x_clean)
 
         # Store model for prediction
-        import uuid
-        model_id = f"fit_{uuid.uuid4().hex[:8]}"
         self._fitted_models[model_id] = best_fit
+        if len(self._fitted_models) > self.MAX_FITTED_MODELS:
+            self._fitted_models.popitem(last=False)
+
+        return self._fit_response(model_id, best_fit)
 
+    def _fit_response(self, model_id: str, best_fit: FitResult) -> MathResult:
+        """Build the curve_fit response for a stored model."""
         return MathResult(
             result={
                 "model_id": model_id,
@@ -251,8 +519,8 @@ class CurveFitCapability(MathCapability):
                     "rmse": round(best_fit.rmse, 4),
                     "aic": round(best_fit.aic, 2)
                 },
-                "data_points": len(x_clean),
-                "outliers_removed": len(x) - len(x_clean)
+                "data_points": best_fit.data_points,
+                "outliers_removed": best_fit.outliers_removed
             },
             shape=[],
             dtype="object"
@@ -266,20 +534,20 @@ class CurveFitCapability(MathCapability):
         if not model_id or x_in is None:
             raise InvalidInputError("model_id and x are required")
 
-        if model_id not in self._fitted_models:
+        fit = self._fitted_models.get(model_id)
+        if fit is None:
             raise InvalidInputError(f"Model '{model_id}' not found. It may have expired or never existed.")
-
-        fit = self._fitted_models[model_id]
+        self._fitted_models.move_to_end(model_id)
         
-        # Predict
+        # Predict; predict_fn returns an ndarray, converted once here
         try:
             y_pred = fit.predict_fn(x_in)
         except Exception as e:
             raise InvalidInputError(f"Prediction failed: {str(e)}")
 
         return MathResult(
-            result=y_pred,
-            shape=[len(y_pred)],
+            result=y_pred.tolist(),
+            shape=list(y_pred.shape),
             dtype="float64"
         )
 
@@ -288,14 +556,15 @@ class CurveFitCapability(MathCapability):
     def _calculate_metrics(self, y_true: np.ndarray, y_pred: np.ndarray, n_params: int) -> Tuple[float, float, float]:
         """Calculate R², RMSE, and AIC."""
         n = len(y_true)
-        residuals = y_true - y_pred
-        sse = np.sum(residuals**2)
+        sse, sst = _sse_sst(
+            np.ascontiguousarray(y_true, dtype=np.float64),
+            np.ascontiguousarray(y_pred, dtype=np.float64),
+        )
         
         # RMSE
         rmse = np.sqrt(sse / n)
         
         # R-squared
-        sst = np.sum((y_true - np.mean(y_true))**2)
         if sst < 1e-10:
             r_sq = 0.0 # Constant line
         else:
@@ -310,33 +579,78 @@ class CurveFitCapability(MathCapability):
             
         return r_sq, rmse, aic
 
+    def _fit_polynomials(self, x: np.ndarray, y: np.ndarray, min_deg: int,
+                         max_deg: int, early_stop: bool = False) -> List[Optional[FitResult]]:
+        """Fit polynomials of degree min_deg..max_deg from one QR factorization.
+
+        With Vandermonde columns ordered 1, x, x^2, ..., the leading d+1
+        columns of Q and the leading (d+1)x(d+1) block of R are the QR of the
+        degree-d design matrix, so every degree is a small triangular solve.
+        Columns are scaled to unit norm first, as np.polyfit does.
+
+        With early_stop, higher degrees are skipped once AIC has risen on two
+        consecutive degrees (after at least three fits), since on smooth data
+        AIC falls and then keeps rising as extra terms only add penalty.
+        """
+        if max_deg < min_deg:
+            return []
+        if max_deg >= len(x):
+            # Under-determined: leave these to polyfit's SVD path
+            return [self._fit_polynomial(x, y, d) for d in range(min_deg, max_deg + 1)]
+
+        try:
+            vander = np.vander(x, max_deg + 1, increasing=True)
+            scale = np.sqrt((vander * vander).sum(axis=0))
+            scale[scale == 0] = 1.0
+            q, r = np.linalg.qr(vander / scale)
+            qty = q.T @ y
+        except Exception:
+            return [self._fit_polynomial(x, y, d) for d in range(min_deg, max_deg + 1)]
+
+        diag = np.abs(np.diag(r))
+        tol = diag.max() * len(x) * np.finfo(np.float64).eps
+
+        fits: List[Optional[FitResult]] = []
+        prev_aic = np.inf
+        rises = 0
+        for d in range(min_deg, max_deg + 1):
+            k = d + 1
+            if diag[:k].min() <= tol:
+                # Rank deficient at this degree; polyfit handles it via SVD
+                fit = self._fit_polynomial(x, y, d)
+            else:
+                scaled = np.linalg.solve(np.triu(r[:k, :k]), qty[:k])
+                y_pred = vander[:, :k] @ (scaled / scale[:k])
+                # Highest power first, matching np.polyfit
+                coeffs = (scaled / scale[:k])[::-1]
+                fit = self._polynomial_result(y, coeffs, y_pred, d)
+            fits.append(fit)
+
+            if early_stop and fit is not None:
+                rises = rises + 1 if fit.aic > prev_aic else 0
+                prev_aic = fit.aic
+                if rises >= 2 and len(fits) >= 3:
+                    break
+        return fits
+
     def _fit_polynomial(self, x: np.ndarray, y: np.ndarray, degree: int) -> Optional[FitResult]:
         """Fit polynomial of given degree using NumPy."""
         try:
             coeffs = np.polyfit(x, y, degree)
             y_pred = np.polyval(coeffs, x)
-            
+            return self._polynomial_result(y, coeffs, y_pred, degree)
+        except Exception:
+            return None
+
+    def _polynomial_result(self, y: np.ndarray, coeffs: np.ndarray, y_pred: np.ndarray,
+                           degree: int) -> Optional[FitResult]:
+        """Build a FitResult from polynomial coefficients (highest power first)."""
+        try:
             r_sq, rmse, aic = self._calculate_metrics(y, y_pred, degree + 1)
             
-            # Format equation
-            terms = []
-            for i, c in enumerate(coeffs):
-                power = degree - i
-                if abs(c) < 1e-10:
-                    continue
-                
-                c_str = f"{c:.4g}"
-                if power == 0:
-                    terms.append(c_str)
-                elif power == 1:
-                    terms.append(f"{c_str}x")
-                else:
-                    terms.append(f"{c_str}x^{power}")
-            
-            eq = "y = " + " + ".join(terms).replace("+ -", "- ")
-            
-            # Capture coeffs for closure
+            # Bind coeffs into the closure; the array is reused by every predict
             c_list = coeffs.tolist()
+            c_arr = np.ascontiguousarray(coeffs, dtype=np.float64)
             
             return FitResult(
                 model_type=f"polynomial_deg{degree}",
@@ -344,14 +658,13 @@ class CurveFitCapability(MathCapability):
                 r_squared=r_sq,
                 rmse=rmse,
                 aic=aic,
-                equation=eq,
-                predict_fn=lambda x_new: np.polyval(c_list, x_new).tolist()
+                predict_fn=lambda x_new, _c=c_arr: _predict_poly(x_new, _c)
             )
         except Exception:
             return None
 
     def _fit_exponential(self, x: np.ndarray, y: np.ndarray) -> Optional[FitResult]:
-        """Fit y = a * exp(b * x) + c using TensorFlow."""
+        """Fit y = a * exp(b * x) + c using SciPy Levenberg-Marquardt."""
         try:
             # Smart initialization
             # 1. Estimate c
@@ -360,20 +673,18 @@ class CurveFitCapability(MathCapability):
             # But for robustness, let's just try a few guesses or use a heuristic.
             # Heuristic: c is slightly below min(y) if a > 0.
             
-            y_min = np.min(y)
-            y_max = np.max(y)
+            y_min, y_max = _min_max(np.ascontiguousarray(y, dtype=np.float64))
             y_range = y_max - y_min
             
             # Guess c is just below min y (assuming decay to asymptote or growth from asymptote)
             c_init = y_min - (y_range * 0.1) 
             
             # Linearize: ln(y - c) = ln(a) + bx
-            # We need y - c > 0
-            y_shifted = y - c_init
-            if np.any(y_shifted <= 0):
+            # We need y - c > 0; the smallest shifted value is y_min - c
+            if not y_min - c_init > 0:
                 # Fallback
                 c_init = y_min - 1.0
-                y_shifted = y - c_init
+            y_shifted = y - c_init
             
             # Fit line to log(y_shifted)
             try:
@@ -387,29 +698,12 @@ class CurveFitCapability(MathCapability):
                 b_init = 0.1
                 c_init = 0.0
 
-            # Use TF for optimization
-            a = tf.Variable(a_init, dtype=tf.float64)
-            b = tf.Variable(b_init, dtype=tf.float64)
-            c = tf.Variable(c_init, dtype=tf.float64)
-            
-            x_tf = tf.constant(x, dtype=tf.float64)
-            y_tf = tf.constant(y, dtype=tf.float64)
-            
-            optimizer = tf.optimizers.Adam(learning_rate=0.01)  # type: ignore
-            
-            # Training loop
-            for _ in range(1000):
-                with tf.GradientTape() as tape:
-                    y_pred = a * tf.exp(b * x_tf) + c  # type: ignore
-                    loss = tf.reduce_mean(tf.square(y_tf - y_pred))
-                
-                grads = tape.gradient(loss, [a, b, c])
-                optimizer.apply_gradients(zip(grads, [a, b, c]))  # type: ignore
-                
-            # Extract values
-            a_val, b_val, c_val = float(a.numpy()), float(b.numpy()), float(c.numpy())  # type: ignore
-            
-            y_pred_final = a_val * np.exp(b_val * x) + c_val
+            # Levenberg-Marquardt from the linearized guess
+            a_val, b_val, c_val = _least_squares(
+                _exp_model, _exp_jac, x, y, [a_init, b_init, c_init]
+            )
+
+            y_pred_final = _predict_exp(x, a_val, b_val, c_val)
             r_sq, rmse, aic = self._calculate_metrics(y, y_pred_final, 3)
             
             return FitResult(
@@ -418,20 +712,16 @@ class CurveFitCapability(MathCapability):
                 r_squared=r_sq,
                 rmse=rmse,
                 aic=aic,
-                equation=f"y = {a_val:.4g} * e^({b_val:.4g}x) + {c_val:.4g}",
-                predict_fn=lambda x_new: (a_val * np.exp(b_val * np.array(x_new)) + c_val).tolist()
+                predict_fn=lambda x_new, _a=a_val, _b=b_val, _c=c_val: _predict_exp(x_new, _a, _b, _c)
             )
         except Exception:
             return None
 
-    def _fit_logarithmic(self, x: np.ndarray, y: np.ndarray) -> Optional[FitResult]:
-        """Fit y = a + b * ln(x)."""
-        if np.any(x <= 0):
-            return None
-            
+    def _fit_logarithmic(self, x: np.ndarray, y: np.ndarray,
+                         x_log: np.ndarray) -> Optional[FitResult]:
+        """Fit y = a + b * ln(x), given x_log = ln(x) for strictly positive x."""
         try:
             # Linear fit on transformed x
-            x_log = np.log(x)
             coeffs = np.polyfit(x_log, y, 1) # [b, a]
             b_val, a_val = coeffs[0], coeffs[1]
             
@@ -444,27 +734,21 @@ class CurveFitCapability(MathCapability):
                 r_squared=r_sq,
                 rmse=rmse,
                 aic=aic,
-                equation=f"y = {a_val:.4g} + {b_val:.4g} * ln(x)",
-                predict_fn=lambda x_new: (a_val + b_val * np.log(np.array(x_new))).tolist()
+                predict_fn=lambda x_new, _a=a_val, _b=b_val: _a + _b * np.log(np.asarray(x_new, dtype=np.float64))
             )
         except Exception:
             return None
 
-    def _fit_power(self, x: np.ndarray, y: np.ndarray) -> Optional[FitResult]:
-        """Fit y = a * x^b."""
-        if np.any(x <= 0) or np.any(y <= 0):
-            return None
-            
+    def _fit_power(self, x: np.ndarray, y: np.ndarray,
+                   x_log: np.ndarray, y_log: np.ndarray) -> Optional[FitResult]:
+        """Fit y = a * x^b, given x_log = ln(x) and y_log = ln(y) for strictly positive data."""
         try:
             # Linear fit on log-log: ln(y) = ln(a) + b * ln(x)
-            x_log = np.log(x)
-            y_log = np.log(y)
-            
             coeffs = np.polyfit(x_log, y_log, 1) # [b, ln(a)]
             b_val = coeffs[0]
             a_val = np.exp(coeffs[1])
             
-            y_pred = a_val * np.power(x, b_val)
+            y_pred = _predict_power(x, a_val, b_val)
             r_sq, rmse, aic = self._calculate_metrics(y, y_pred, 2)
             
             return FitResult(
@@ -473,42 +757,26 @@ class CurveFitCapability(MathCapability):
                 r_squared=r_sq,
                 rmse=rmse,
                 aic=aic,
-                equation=f"y = {a_val:.4g} * x^{b_val:.4g}",
-                predict_fn=lambda x_new: (a_val * np.power(np.array(x_new), b_val)).tolist()
+                predict_fn=lambda x_new, _a=a_val, _b=b_val: _predict_power(x_new, _a, _b)
             )
         except Exception:
             return None
 
     def _fit_sigmoid(self, x: np.ndarray, y: np.ndarray) -> Optional[FitResult]:
-        """Fit y = L / (1 + e^(-k(x-x0))) + b using TensorFlow."""
+        """Fit y = L / (1 + e^(-k(x-x0))) + b using SciPy Levenberg-Marquardt."""
         try:
             # Initial guesses
-            L_init = np.max(y) - np.min(y)
-            b_init = np.min(y)
+            y_min, y_max = _min_max(np.ascontiguousarray(y, dtype=np.float64))
+            L_init = y_max - y_min
+            b_init = y_min
             x0_init = np.median(x)
             k_init = 1.0
             
-            L = tf.Variable(L_init, dtype=tf.float64)
-            k = tf.Variable(k_init, dtype=tf.float64)
-            x0 = tf.Variable(x0_init, dtype=tf.float64)
-            b = tf.Variable(b_init, dtype=tf.float64)
-            
-            x_tf = tf.constant(x, dtype=tf.float64)
-            y_tf = tf.constant(y, dtype=tf.float64)
-            
-            optimizer = tf.optimizers.Adam(learning_rate=0.05)  # type: ignore
-            
-            for _ in range(800):
-                with tf.GradientTape() as tape:
-                    y_pred = L / (1.0 + tf.exp(-k * (x_tf - x0))) + b  # type: ignore
-                    loss = tf.reduce_mean(tf.square(y_tf - y_pred))
-                
-                grads = tape.gradient(loss, [L, k, x0, b])
-                optimizer.apply_gradients(zip(grads, [L, k, x0, b]))  # type: ignore
-                
-            L_val, k_val, x0_val, b_val = float(L.numpy()), float(k.numpy()), float(x0.numpy()), float(b.numpy())  # type: ignore
-            
-            y_pred_final = L_val / (1.0 + np.exp(-k_val * (x - x0_val))) + b_val
+            L_val, k_val, x0_val, b_val = _least_squares(
+                _sigmoid_model, _sigmoid_jac, x, y, [L_init, k_init, x0_init, b_init]
+            )
+
+            y_pred_final = _predict_sigmoid(x, L_val, k_val, x0_val, b_val)
             r_sq, rmse, aic = self._calculate_metrics(y, y_pred_final, 4)
             
             return FitResult(
@@ -517,8 +785,9 @@ class CurveFitCapability(MathCapability):
                 r_squared=r_sq,
                 rmse=rmse,
                 aic=aic,
-                equation=f"y = {L_val:.4g} / (1 + e^(-{k_val:.4g}(x - {x0_val:.4g}))) + {b_val:.4g}",
-                predict_fn=lambda x_new: (L_val / (1.0 + np.exp(-k_val * (np.array(x_new) - x0_val))) + b_val).tolist()
+                predict_fn=lambda x_new, _L=L_val, _k=k_val, _x0=x0_val, _b=b_val: _predict_sigmoid(
+                    x_new, _L, _k, _x0, _b
+                )
             )
         except Exception:
             return None
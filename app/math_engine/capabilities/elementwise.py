@@ -2,30 +2,75 @@
 
 Provides high-performance element-wise mathematical computations
 with automatic broadcasting support.
+
+Operations run on NumPy by default. Setting GOFRNP_ELEMENTWISE_BACKEND=tensorflow
+(with the optional ``tensorflow`` extra installed) routes them through
+TensorFlow instead, which only pays off for large arrays on a GPU host.
 """
 
 from __future__ import annotations
 
+import base64
+import math
+import operator
 import os
-from typing import Any, Dict, List, Literal, Union
+from typing import Any, Callable, Dict, List, Literal, Tuple, Union
+
+import numpy as np
+from scipy.special import expit
+
+try:
+    import numexpr
+except ImportError:  # pragma: no cover - numexpr is an optional extra
+    numexpr = None
+
+from app.logger import session_logger as logger
+from app.logger.decorators import log_execution_time
+from app.math_engine.base import MathCapability, MathResult, ToolDefinition
+from app.exceptions import InvalidInputError
+
+ELEMENTWISE_BACKEND = os.environ.get("GOFRNP_ELEMENTWISE_BACKEND", "numpy").lower()
 
-# Suppress TensorFlow logging before import
-os.environ.setdefault("TF_CPP_MIN_LOG_LEVEL", "2")
+if ELEMENTWISE_BACKEND == "tensorflow":
+    # Suppress TensorFlow logging before import
+    os.environ.setdefault("TF_CPP_MIN_LOG_LEVEL", "2")
+
+    import tensorflow as tf
+
+    # Disable TensorFlow warnings
+    tf.get_logger().setLevel("ERROR")
+
+    # Elementwise tensors are usually small, and sharding one op over every
+    # core costs more in pool synchronisation than it saves. Raise these for
+    # workloads dominated by large arrays. Must run before the first op.
+    try:
+        tf.config.threading.set_intra_op_parallelism_threads(
+            int(os.environ.get("GOFRNP_TF_INTRA_OP_THREADS", "1"))
+        )
+        tf.config.threading.set_inter_op_parallelism_threads(
+            int(os.environ.get("GOFRNP_TF_INTER_OP_THREADS", "2"))
+        )
+    except RuntimeError as e:
+        logger.warning("TensorFlow thread pools already initialized", error=str(e))
 
-import tensorflow as tf  # noqa: E402 - must be after env var is set
+else:
+    tf = None
 
-# Disable TensorFlow warnings
-tf.get_logger().setLevel("ERROR")
+# Opt-in XLA compilation for the TensorFlow backend. It fuses multi-kernel ops
+# such as log10 (log then divide) but can regress on tiny inputs.
+_USE_XLA = tf is not None and os.environ.get("GOFRNP_ELEMENTWISE_XLA", "0") == "1"
 
-from app.logger import session_logger as logger  # noqa: E402 - must be after tf config
-from app.logger.decorators import log_execution_time  # noqa: E402
-from app.math_engine.base import MathCapability, MathResult, ToolDefinition  # noqa: E402
-from app.exceptions import InvalidInputError  # noqa: E402
+# XLA-compiled concrete functions keyed by operation and operand rank/dtype.
+# Dimensions are left unknown so one trace serves every size of a rank.
+_XLA_FUNCTIONS: Dict[Tuple[Any, ...], Any] = {}
 
 
 # Type aliases
 ArrayLike = Union[List[Any], float, int]
 Precision = Literal["float32", "float64"]
+ReturnFormat = Literal["list", "b64"]
+
+RETURN_FORMATS = ("list", "b64")
 
 # Supported operations
 UNARY_OPS = frozenset({
@@ -48,6 +93,190 @@ BINARY_OPS = frozenset({
 
 ALL_OPS = UNARY_OPS | BINARY_OPS
 
+# Sorted once for tool schemas, listings and error messages
+_UNARY_OPS_SORTED = tuple(sorted(UNARY_OPS))
+_BINARY_OPS_SORTED = tuple(sorted(BINARY_OPS))
+_ALL_OPS_SORTED = tuple(sorted(ALL_OPS))
+
+# Operations whose result is boolean rather than the input precision
+BOOLEAN_OPS = frozenset({
+    "greater", "less", "equal", "not_equal",
+    "greater_equal", "less_equal",
+    "logical_and", "logical_or", "logical_xor",
+})
+
+
+def _relu(x: np.ndarray, out: np.ndarray | None = None) -> np.ndarray:
+    return np.maximum(x, 0, out=out)
+
+
+# Pure Python implementations for finite float64 scalars. Domain errors and
+# overflow raise here, and the caller then falls back to NumPy for nan/inf.
+_SCALAR_UNARY: Dict[str, Callable[[float], Any]] = {
+    "exp": math.exp,
+    "log": math.log,
+    "log10": math.log10,
+    "log2": math.log2,
+    "sqrt": math.sqrt,
+    "square": lambda x: x * x,
+    "abs": abs,
+    "sin": math.sin,
+    "cos": math.cos,
+    "tan": math.tan,
+    "sinh": math.sinh,
+    "cosh": math.cosh,
+    "tanh": math.tanh,
+    # math.floor/ceil/round return ints; copysign restores -0.0 as NumPy keeps it
+    "floor": lambda x: math.copysign(float(math.floor(x)), x),
+    "ceil": lambda x: math.copysign(float(math.ceil(x)), x),
+    "round": lambda x: math.copysign(float(round(x)), x),  # half to even, as np.rint
+    "negate": operator.neg,
+    "reciprocal": lambda x: 1.0 / x,
+    "sign": lambda x: (x > 0) - (x < 0),
+    "sigmoid": lambda x: 1.0 / (1.0 + math.exp(-x)),
+    "relu": lambda x: max(0.0, x),  # np.maximum(x, 0): 0.0 for -0.0
+}
+
+_SCALAR_BINARY: Dict[str, Callable[[float, float], Any]] = {
+    "add": operator.add,
+    "subtract": operator.sub,
+    "multiply": operator.mul,
+    "divide": operator.truediv,
+    "power": math.pow,
+    "mod": operator.mod,  # floor mod, as np.mod
+    # Ties (0.0 vs -0.0) give the second operand, as np.maximum/np.minimum do;
+    # max/min keep their first argument on a tie
+    "maximum": lambda x, y: max(y, x),
+    "minimum": lambda x, y: min(y, x),
+    "greater": operator.gt,
+    "less": operator.lt,
+    "equal": operator.eq,
+    "not_equal": operator.ne,
+    "greater_equal": operator.ge,
+    "less_equal": operator.le,
+    "logical_and": lambda x, y: bool(x) and bool(y),
+    "logical_or": lambda x, y: bool(x) or bool(y),
+    "logical_xor": lambda x, y: bool(x) != bool(y),
+}
+
+# Unary ops NumPy runs without SIMD kernels. On large arrays and multi-core
+# hosts numexpr evaluates them blockwise across its thread pool instead; on
+# a single core it is no faster, so it is not used there.
+_NUMEXPR_UNARY: Dict[str, str] = {
+    "sin": "sin(a)",
+    "cos": "cos(a)",
+    "tan": "tan(a)",
+    "sinh": "sinh(a)",
+    "cosh": "cosh(a)",
+    "tanh": "tanh(a)",
+    "log10": "log10(a)",
+    "sigmoid": "1 / (1 + exp(-a))",
+}
+NUMEXPR_MIN_SIZE = 65536
+_USE_NUMEXPR = numexpr is not None and numexpr.detect_number_of_cores() > 1
+
+# NumPy implementations; each accepts out= so chains can run in place
+_UNARY_UFUNCS: Dict[str, Callable[..., np.ndarray]] = {
+    "exp": np.exp,
+    "log": np.log,
+    "log10": np.log10,
+    "log2": np.log2,
+    "sqrt": np.sqrt,
+    "square": np.square,
+    "abs": np.abs,
+    "sin": np.sin,
+    "cos": np.cos,
+    "tan": np.tan,
+    "sinh": np.sinh,
+    "cosh": np.cosh,
+    "tanh": np.tanh,
+    "floor": np.floor,
+    "ceil": np.ceil,
+    "round": np.rint,  # half to even, as tf.round
+    "negate": np.negative,
+    "reciprocal": np.reciprocal,
+    "sign": np.sign,
+    "sigmoid": expit,
+    "relu": _relu,
+}
+
+_BINARY_UFUNCS: Dict[str, Callable[..., np.ndarray]] = {
+    "add": np.add,
+    "subtract": np.subtract,
+    "multiply": np.multiply,
+    "divide": np.true_divide,
+    "power": np.power,
+    "mod": np.mod,  # floor mod, as tf.math.mod
+    "maximum": np.maximum,
+    "minimum": np.minimum,
+    "greater": np.greater,
+    "less": np.less,
+    "equal": np.equal,
+    "not_equal": np.not_equal,
+    "greater_equal": np.greater_equal,
+    "less_equal": np.less_equal,
+    "logical_and": np.logical_and,
+    "logical_or": np.logical_or,
+    "logical_xor": np.logical_xor,
+}
+
+
+if tf is not None:
+    # 1/ln(10) and 1/ln(2) per dtype, so log10/log2 are one log and one multiply
+    _TF_INV_LN10 = {dt: tf.constant(1.0 / math.log(10.0), dtype=dt) for dt in (tf.float32, tf.float64)}
+    _TF_INV_LN2 = {dt: tf.constant(1.0 / math.log(2.0), dtype=dt) for dt in (tf.float32, tf.float64)}
+
+    def _tf_log10(x: tf.Tensor) -> tf.Tensor:
+        return tf.math.log(x) * _TF_INV_LN10[x.dtype]
+
+    def _tf_log2(x: tf.Tensor) -> tf.Tensor:
+        return tf.math.log(x) * _TF_INV_LN2[x.dtype]
+
+    # TensorFlow implementations for the optional backend
+    _TF_UNARY_OPS: Dict[str, Callable[..., Any]] = {
+        "exp": tf.exp,
+        "log": tf.math.log,
+        "log10": _tf_log10,
+        "log2": _tf_log2,
+        "sqrt": tf.sqrt,
+        "square": tf.square,
+        "abs": tf.abs,
+        "sin": tf.sin,
+        "cos": tf.cos,
+        "tan": tf.tan,
+        "sinh": tf.sinh,
+        "cosh": tf.cosh,
+        "tanh": tf.tanh,
+        "floor": tf.floor,
+        "ceil": tf.math.ceil,
+        "round": tf.round,
+        "negate": tf.negative,
+        "reciprocal": tf.math.reciprocal,
+        "sign": tf.sign,
+        "sigmoid": tf.sigmoid,
+        "relu": tf.nn.relu,
+    }
+
+    _TF_BINARY_OPS: Dict[str, Callable[..., Any]] = {
+        "add": tf.add,
+        "subtract": tf.subtract,
+        "multiply": tf.multiply,
+        "divide": tf.divide,
+        "power": tf.pow,
+        "mod": tf.math.mod,
+        "maximum": tf.maximum,
+        "minimum": tf.minimum,
+        "greater": tf.greater,
+        "less": tf.less,
+        "equal": tf.equal,
+        "not_equal": tf.not_equal,
+        "greater_equal": tf.greater_equal,
+        "less_equal": tf.less_equal,
+        "logical_and": tf.logical_and,
+        "logical_or": tf.logical_or,
+        "logical_xor": tf.math.logical_xor,
+    }
+
 
 class ElementwiseCapability(MathCapability):
     """Element-wise mathematical operations with broadcasting."""
@@ -72,7 +301,7 @@ class ElementwiseCapability(MathCapability):
                         "operation": {
                             "type": "string",
                             "description": "The mathematical operation to perform.",
-                            "enum": sorted(ALL_OPS),
+                            "enum": list(_ALL_OPS_SORTED),
                         },
                         "a": {
                             "description": "First operand (scalar or array).",
@@ -92,15 +321,123 @@ class ElementwiseCapability(MathCapability):
                         },
                         "precision": {
                             "type": "string",
-                            "description": "Computation precision.",
+                            "description": "Computation precision. float32 keeps about 7 significant digits and is faster on large arrays; use float64 when more digits matter.",
                             "enum": ["float32", "float64"],
                             "default": "float64",
                         },
+                        "return_format": {
+                            "type": "string",
+                            "description": "'list' returns nested lists. 'b64' returns the raw little-endian, C-order buffer base64-encoded; rebuild it with np.frombuffer(base64.b64decode(result), dtype).reshape(shape). Prefer 'b64' for large arrays.",
+                            "enum": list(RETURN_FORMATS),
+                            "default": "list",
+                        },
                     },
                     "required": ["operation", "a"],
                 },
                 handler_name="handle",
             ),
+            ToolDefinition(
+                name="math_compute_expr",
+                description="Apply a chain of element-wise operations to one operand in a single call, e.g. sigmoid(a) + b. Each step works on the previous result without materializing intermediates.",
+                input_schema={
+                    "type": "object",
+                    "properties": {
+                        "a": {
+                            "description": "Initial operand (scalar or array).",
+                            "anyOf": [
+                                {"type": "number"},
+                                {"type": "array", "items": {"type": "number"}},
+                                {"type": "array", "items": {"type": "array"}},
+                            ],
+                        },
+                        "ops": {
+                            "type": "array",
+                            "description": "Operations applied in order to the running result.",
+                            "minItems": 1,
+                            "items": {
+                                "type": "object",
+                                "properties": {
+                                    "op": {
+                                        "type": "string",
+                                        "enum": list(_ALL_OPS_SORTED),
+                                    },
+                                    "b": {
+                                        "description": "Second operand for binary operations.",
+                                        "anyOf": [
+                                            {"type": "number"},
+                                            {"type": "array", "items": {"type": "number"}},
+                                            {"type": "array", "items": {"type": "array"}},
+                                        ],
+                                    },
+                                },
+                                "required": ["op"],
+                            },
+                        },
+                        "precision": {
+                            "type": "string",
+                            "description": "Computation precision. float32 keeps about 7 significant digits and is faster on large arrays; use float64 when more digits matter.",
+                            "enum": ["float32", "float64"],
+                            "default": "float64",
+                        },
+                        "return_format": {
+                            "type": "string",
+                            "description": "'list' returns nested lists. 'b64' returns the raw little-endian, C-order buffer base64-encoded; rebuild it with np.frombuffer(base64.b64decode(result), dtype).reshape(shape). Prefer 'b64' for large arrays.",
+                            "enum": list(RETURN_FORMATS),
+                            "default": "list",
+                        },
+                    },
+                    "required": ["a", "ops"],
+                },
+                handler_name="handle",
+            ),
+            ToolDefinition(
+                name="math_compute_batch",
+                description="Run several independent element-wise operations in one call. Returns one {result, shape, dtype} entry per operation, in order.",
+                input_schema={
+                    "type": "object",
+                    "properties": {
+                        "ops": {
+                            "type": "array",
+                            "description": "Operations to run, each with its own operands.",
+                            "minItems": 1,
+                            "items": {
+                                "type": "object",
+                                "properties": {
+                                    "operation": {
+                                        "type": "string",
+                                        "enum": list(_ALL_OPS_SORTED),
+                                    },
+                                    "a": {
+                                        "description": "First operand (scalar or array).",
+                                        "anyOf": [
+                                            {"type": "number"},
+                                            {"type": "array", "items": {"type": "number"}},
+                                            {"type": "array", "items": {"type": "array"}},
+                                        ],
+                                    },
+                                    "b": {
+                                        "description": "Second operand for binary operations.",
+                                        "anyOf": [
+                                            {"type": "number"},
+                                            {"type": "array", "items": {"type": "number"}},
+                                            {"type": "array", "items": {"type": "array"}},
+                                        ],
+                                    },
+                                },
+                                "required": ["operation", "a"],
+                            },
+                        },
+                        "precision": {
+                            "type": "string",
+                            "description": "Computation precision for every operation. float32 keeps about 7 significant digits and is faster on large arrays; use float64 when more digits matter.",
+                            "enum": ["float32", "float64"],
+                            "default": "float64",
+                        },
+                    },
+                    "required": ["ops"],
+                },
+                handler_name="handle",
+            ),
             ToolDefinition(
                 name="math_list_operations",
                 description="List all supported mathematical operations.",
@@ -124,13 +461,34 @@ class ElementwiseCapability(MathCapability):
             a = arguments.get("a")
             b = arguments.get("b")
             precision = arguments.get("precision", "float64")
+            return_format = arguments.get("return_format", "list")
 
             if not operation:
                 raise InvalidInputError("Missing required argument: operation")
             if a is None:
                 raise InvalidInputError("Missing required argument: a")
 
-            return self.compute(operation, a, b, precision)
+            return self.compute(operation, a, b, precision, return_format)
+        elif tool_name == "math_compute_expr":
+            a = arguments.get("a")
+            ops = arguments.get("ops")
+            precision = arguments.get("precision", "float64")
+            return_format = arguments.get("return_format", "list")
+
+            if a is None:
+                raise InvalidInputError("Missing required argument: a")
+            if not ops:
+                raise InvalidInputError("Missing required argument: ops")
+
+            return self.compute_expr(a, ops, precision, return_format)
+        elif tool_name == "math_compute_batch":
+            ops = arguments.get("ops")
+            precision = arguments.get("precision", "float64")
+
+            if not ops:
+                raise InvalidInputError("Missing required argument: ops")
+
+            return self.compute_batch(ops, precision)
         elif tool_name == "math_list_operations":
             ops = self.list_operations()
             return MathResult(
@@ -141,32 +499,48 @@ class ElementwiseCapability(MathCapability):
         else:
             raise InvalidInputError(f"Unknown tool: {tool_name}")
 
-    def _to_tensor(self, data: ArrayLike, precision: Precision) -> tf.Tensor:
-        """Convert input to TensorFlow tensor with specified precision."""
-        dtype = tf.float64 if precision == "float64" else tf.float32
+    def _to_array(self, data: ArrayLike, precision: Precision,
+                  keep_bool: bool = False) -> np.ndarray:
+        """
+        Convert input to a NumPy array with specified precision.
+
+        With keep_bool, all-boolean input stays a bool array instead of being
+        widened to float, so logical operations can use it as is.
+        """
+        dtype = np.float64 if precision == "float64" else np.float32
         try:
-            return tf.convert_to_tensor(data, dtype=dtype)
+            if keep_bool:
+                array = np.asarray(data)
+                return array if array.dtype == np.bool_ else array.astype(dtype)
+            return np.asarray(data, dtype=dtype)
         except (ValueError, TypeError) as e:
-            raise InvalidInputError(f"Failed to convert input to tensor: {str(e)}")
+            raise InvalidInputError(f"Failed to convert input to array: {str(e)}")
 
-    def _to_result(self, tensor: tf.Tensor) -> MathResult:
-        """Convert tensor to MathResult."""
-        numpy_result = tensor.numpy()  # type: ignore[union-attr]
+    def _to_result(self, array: np.ndarray, return_format: ReturnFormat = "list") -> MathResult:
+        """Convert array to MathResult, as nested lists or a base64 buffer."""
+        # Ufuncs return NumPy scalars for 0-d input
+        array = np.asarray(array)
+
+        if return_format == "b64":
+            # One C-level copy; no per-element Python objects
+            raw = np.ascontiguousarray(array, dtype=array.dtype.newbyteorder("<")).tobytes()
+            return MathResult(
+                result=base64.b64encode(raw).decode("ascii"),
+                shape=list(array.shape),
+                dtype=str(array.dtype),
+            )
 
         # Convert to nested Python lists for JSON serialization
-        if numpy_result.ndim == 0:
+        if array.ndim == 0:
             # Scalar
-            result_list = float(numpy_result)
+            result_list = float(array)
         else:
-            result_list = numpy_result.tolist()
-
-        shape_list: list[int] = tensor.shape.as_list()  # type: ignore[assignment]
-        dtype_name = str(tensor.dtype.name)  # type: ignore[union-attr]
+            result_list = array.tolist()
 
         return MathResult(
             result=result_list,
-            shape=shape_list,
-            dtype=dtype_name,
+            shape=list(array.shape),
+            dtype=str(array.dtype),
         )
 
     def compute(
@@ -175,6 +549,7 @@ class ElementwiseCapability(MathCapability):
         a: ArrayLike,
         b: ArrayLike | None = None,
         precision: Precision = "float64",
+        return_format: ReturnFormat = "list",
     ) -> MathResult:
         """
         Perform an element-wise mathematical operation.
@@ -184,6 +559,7 @@ class ElementwiseCapability(MathCapability):
             a: First operand (array or scalar)
             b: Second operand for binary operations (array or scalar)
             precision: Numeric precision ("float32" or "float64")
+            return_format: "list" for nested lists, "b64" for a base64 buffer
 
         Returns:
             MathResult with the computed result, shape, and dtype
@@ -196,107 +572,310 @@ class ElementwiseCapability(MathCapability):
         if operation not in ALL_OPS:
             raise InvalidInputError(
                 f"Unknown operation: '{operation}'. "
-                f"Supported: {sorted(ALL_OPS)}"
+                f"Supported: {list(_ALL_OPS_SORTED)}"
             )
 
-        # Convert inputs to tensors
-        tensor_a = self._to_tensor(a, precision)
+        if operation in BINARY_OPS and b is None:
+            raise InvalidInputError(
+                f"Operation '{operation}' requires two operands (b is missing)"
+            )
+        self._check_return_format(return_format)
+
+        if precision == "float64" and return_format == "list":
+            scalar = self._scalar_compute(operation, a, b)
+            if scalar is not None:
+                return scalar
+
+        # Convert inputs to arrays
+        logical = operation.startswith("logical_")
+        array_a = self._to_array(a, precision, keep_bool=logical)
+        array_b = self._to_array(b, precision, keep_bool=logical) if operation in BINARY_OPS else None
+
+        if array_b is not None and self._is_identity(operation, array_b):
+            result = array_a
+        elif tf is not None:
+            result = self._tf_compute(operation, array_a, array_b)
+        elif array_b is None:
+            result = self._unary_op(operation, array_a)
+        else:
+            result = self._binary_op(operation, array_a, array_b)
 
-        # Handle unary operations
-        if operation in UNARY_OPS:
-            result = self._unary_op(operation, tensor_a)
+        logger.debug(
+            "Math compute completed",
+            operation=operation,
+            input_shape=list(array_a.shape),
+            output_shape=list(np.shape(result)),
+        )
+
+        return self._to_result(result, return_format)
+
+    def _scalar_compute(self, operation: str, a: Any, b: Any) -> MathResult | None:
+        """
+        Compute a float64 operation on finite scalars without building arrays.
 
-        # Handle binary operations
-        elif operation in BINARY_OPS:
+        Returns None when the inputs are not plain finite scalars or the
+        result is not finite, leaving those cases to the NumPy path.
+        """
+        if not isinstance(a, (int, float)) or (b is not None and not isinstance(b, (int, float))):
+            return None
+        try:
+            x = float(a)
+            y = float(b) if b is not None else 0.0
+            if not (math.isfinite(x) and math.isfinite(y)):
+                return None
             if b is None:
+                value = float(_SCALAR_UNARY[operation](x))
+            else:
+                value = float(_SCALAR_BINARY[operation](x, y))
+        except (ArithmeticError, ValueError, KeyError):
+            return None
+        if not math.isfinite(value):
+            return None
+        return MathResult(
+            result=value,
+            shape=[],
+            dtype="bool" if operation in BOOLEAN_OPS else "float64",
+        )
+
+    def compute_batch(
+        self,
+        ops: List[Dict[str, Any]],
+        precision: Precision = "float64",
+    ) -> MathResult:
+        """
+        Run several independent operations in one call.
+
+        Args:
+            ops: Entries as {"operation": name, "a": operand, "b": operand}
+            precision: Numeric precision for every entry
+
+        Returns:
+            MathResult whose result is {"results": [...]}, one to_dict() per entry
+
+        Raises:
+            InvalidInputError: If any entry is invalid; the message names its index
+        """
+        results = []
+        for i, entry in enumerate(ops):
+            if not isinstance(entry, dict) or not entry.get("operation"):
+                raise InvalidInputError(f"Entry {i} must be an object with an 'operation' field")
+            if entry.get("a") is None:
+                raise InvalidInputError(f"Entry {i}: missing required argument: a")
+            try:
+                result = self.compute(entry["operation"], entry["a"], entry.get("b"), precision)
+            except InvalidInputError as e:
+                raise InvalidInputError(f"Entry {i}: {str(e)}")
+            results.append(result.to_dict())
+
+        return MathResult(
+            result={"results": results},
+            shape=[len(results)],
+            dtype="object",
+        )
+
+    def compute_expr(
+        self,
+        a: ArrayLike,
+        ops: List[Dict[str, Any]],
+        precision: Precision = "float64",
+        return_format: ReturnFormat = "list",
+    ) -> MathResult:
+        """
+        Apply a chain of element-wise operations to a single operand.
+
+        The operand is converted once and every step writes into the same
+        buffer where the result keeps its shape and dtype, so a chain such
+        as sigmoid(a) + b costs one allocation instead of one per step.
+
+        Args:
+            a: Initial operand (array or scalar)
+            ops: Steps as {"op": name} or {"op": name, "b": operand}
+            precision: Numeric precision ("float32" or "float64")
+            return_format: "list" for nested lists, "b64" for a base64 buffer
+
+        Returns:
+            MathResult with the final result, shape, and dtype
+
+        Raises:
+            InvalidInputError: If a step is malformed or shapes are incompatible
+        """
+        self._check_return_format(return_format)
+        steps = []
+        for i, step in enumerate(ops):
+            if not isinstance(step, dict) or not step.get("op"):
+                raise InvalidInputError(f"Step {i} must be an object with an 'op' field")
+            operation = str(step["op"]).lower()
+            if operation not in ALL_OPS:
                 raise InvalidInputError(
-                    f"Operation '{operation}' requires two operands (b is missing)"
+                    f"Unknown operation in step {i}: '{operation}'. "
+                    f"Supported: {list(_ALL_OPS_SORTED)}"
+                )
+            if operation in BINARY_OPS and step.get("b") is None:
+                raise InvalidInputError(
+                    f"Operation '{operation}' in step {i} requires two operands (b is missing)"
+                )
+            steps.append((operation, step.get("b")))
+
+        array_a = self._to_array(a, precision)
+        # The chain writes in place, so never alias the caller's array
+        out = array_a.copy() if array_a is a else array_a
+
+        for operation, b in steps:
+            logical = operation.startswith("logical_")
+            if out.dtype != array_a.dtype and not (logical and out.dtype == np.bool_):
+                # A comparison earlier in the chain; continue in the input precision
+                out = out.astype(array_a.dtype)
+            array_b = self._to_array(b, precision, keep_bool=logical) if operation in BINARY_OPS else None
+
+            if array_b is not None and self._is_identity(operation, array_b):
+                continue
+            if tf is not None:
+                out = np.asarray(self._tf_compute(operation, out, array_b))
+            elif array_b is None:
+                out = np.asarray(self._unary_op(operation, out, out=out))
+            else:
+                in_place = (
+                    operation not in BOOLEAN_OPS
+                    and self._broadcast_shape(out, array_b) == out.shape
+                )
+                out = np.asarray(
+                    self._binary_op(operation, out, array_b, out=out if in_place else None)
                 )
-            tensor_b = self._to_tensor(b, precision)
-            result = self._binary_op(operation, tensor_a, tensor_b)
-
-        else:
-            raise InvalidInputError(f"Operation '{operation}' not implemented")
 
         logger.debug(
-            "Math compute completed",
-            operation=operation,
-            input_shape=tensor_a.shape.as_list(),
-            output_shape=result.shape.as_list(),
+            "Math compute expr completed",
+            steps=len(steps),
+            input_shape=list(array_a.shape),
+            output_shape=list(out.shape),
         )
 
-        return self._to_result(result)
-
-    def _unary_op(self, operation: str, a: tf.Tensor) -> tf.Tensor:
-        """Execute a unary operation."""
-        ops_map = {
-            "exp": tf.exp,
-            "log": tf.math.log,
-            "log10": lambda x: tf.math.log(x) / tf.math.log(tf.constant(10.0, dtype=x.dtype)),
-            "log2": lambda x: tf.math.log(x) / tf.math.log(tf.constant(2.0, dtype=x.dtype)),
-            "sqrt": tf.sqrt,
-            "square": tf.square,
-            "abs": tf.abs,
-            "sin": tf.sin,
-            "cos": tf.cos,
-            "tan": tf.tan,
-            "sinh": tf.sinh,
-            "cosh": tf.cosh,
-            "tanh": tf.tanh,
-            "floor": tf.floor,
-            "ceil": tf.math.ceil,
-            "round": tf.round,
-            "negate": tf.negative,
-            "reciprocal": tf.math.reciprocal,
-            "sign": tf.sign,
-            "sigmoid": tf.sigmoid,
-            "relu": tf.nn.relu,
-        }
+        return self._to_result(out, return_format)
+
+    def _check_return_format(self, return_format: str) -> None:
+        """Reject unknown return formats."""
+        if return_format not in RETURN_FORMATS:
+            raise InvalidInputError(
+                f"Unknown return_format: '{return_format}'. Supported: {list(RETURN_FORMATS)}"
+            )
+
+    def _is_identity(self, operation: str, b: np.ndarray) -> bool:
+        """
+        True if "a <operation> b" is exactly a for every a, so no kernel is needed.
+
+        Only exact IEEE identities qualify: x - (+0.0), x * 1, x / 1 and x ** 1.
+        x + 0 is not one (-0.0 + 0.0 is +0.0) and x * 0 is not (inf * 0 is nan).
+        """
+        if b.ndim != 0:
+            return False
+        if operation in ("multiply", "divide", "power"):
+            return bool(b == 1)
+        if operation == "subtract":
+            return bool(b == 0) and not np.signbit(b)
+        return False
+
+    def _broadcast_shape(self, a: np.ndarray, b: np.ndarray) -> Tuple[int, ...]:
+        """Shape of a op b, or InvalidInputError if they do not broadcast."""
+        try:
+            return np.broadcast_shapes(a.shape, b.shape)
+        except ValueError:
+            raise InvalidInputError(
+                f"Cannot broadcast operands with shapes {list(a.shape)} and {list(b.shape)}"
+            )
 
-        op_func = ops_map.get(operation)
+    def _unary_op(
+        self, operation: str, a: np.ndarray, out: np.ndarray | None = None
+    ) -> np.ndarray:
+        """Execute a unary operation, optionally into a preallocated buffer."""
+        op_func = _UNARY_UFUNCS.get(operation)
         if op_func is None:
             raise InvalidInputError(f"Unary operation '{operation}' not found")
 
-        return op_func(a)
+        if _USE_NUMEXPR and a.size >= NUMEXPR_MIN_SIZE and operation in _NUMEXPR_UNARY:
+            return numexpr.evaluate(_NUMEXPR_UNARY[operation], local_dict={"a": a}, out=out)
 
-    def _binary_op(self, operation: str, a: tf.Tensor, b: tf.Tensor) -> tf.Tensor:
-        """Execute a binary operation with broadcasting."""
-        ops_map = {
-            "add": tf.add,
-            "subtract": tf.subtract,
-            "multiply": tf.multiply,
-            "divide": tf.divide,
-            "power": tf.pow,
-            "mod": tf.math.mod,
-            "maximum": tf.maximum,
-            "minimum": tf.minimum,
-            "greater": tf.greater,
-            "less": tf.less,
-            "equal": tf.equal,
-            "not_equal": tf.not_equal,
-            "greater_equal": tf.greater_equal,
-            "less_equal": tf.less_equal,
-            "logical_and": tf.logical_and,
-            "logical_or": tf.logical_or,
-            "logical_xor": tf.math.logical_xor,
-        }
+        # Domain errors and overflow yield nan/inf, as they did under TensorFlow
+        with np.errstate(all="ignore"):
+            return op_func(a, out=out)
 
-        op_func = ops_map.get(operation)
+    def _binary_op(
+        self, operation: str, a: np.ndarray, b: np.ndarray, out: np.ndarray | None = None
+    ) -> np.ndarray:
+        """Execute a binary operation with broadcasting, optionally into a preallocated buffer."""
+        op_func = _BINARY_UFUNCS.get(operation)
+        if op_func is None:
+            raise InvalidInputError(f"Binary operation '{operation}' not found")
+
+        try:
+            with np.errstate(all="ignore"):
+                return op_func(a, b, out=out)
+        except ValueError:
+            raise InvalidInputError(
+                f"Cannot broadcast operands with shapes {list(a.shape)} and {list(b.shape)}"
+            )
+
+    def _tf_compute(self, operation: str, a: np.ndarray, b: np.ndarray | None) -> np.ndarray:
+        """Execute an operation on the optional TensorFlow backend."""
+        tensor_a = tf.convert_to_tensor(a)
+        if b is None:
+            return self._tf_unary_op(operation, tensor_a).numpy()
+        try:
+            return self._tf_binary_op(operation, tensor_a, tf.convert_to_tensor(b)).numpy()
+        except tf.errors.InvalidArgumentError:
+            raise InvalidInputError(
+                f"Cannot broadcast operands with shapes {list(a.shape)} and {list(b.shape)}"
+            )
+
+    def _tf_unary_op(self, operation: str, a: tf.Tensor) -> tf.Tensor:
+        """Execute a unary operation with TensorFlow."""
+        op_func = _TF_UNARY_OPS.get(operation)
+        if op_func is None:
+            raise InvalidInputError(f"Unary operation '{operation}' not found")
+
+        if _USE_XLA:
+            return self._tf_xla_call(operation, op_func, a)
+        return op_func(a)
+
+    def _tf_binary_op(self, operation: str, a: tf.Tensor, b: tf.Tensor) -> tf.Tensor:
+        """Execute a binary operation with broadcasting with TensorFlow."""
+        op_func = _TF_BINARY_OPS.get(operation)
         if op_func is None:
             raise InvalidInputError(f"Binary operation '{operation}' not found")
 
         # Handle logical operations (need boolean tensors)
         if operation.startswith("logical_"):
-            a = tf.cast(a, tf.bool)  # type: ignore
-            b = tf.cast(b, tf.bool)  # type: ignore
+            if a.dtype != tf.bool:
+                a = tf.cast(a, tf.bool)  # type: ignore
+            if b.dtype != tf.bool:
+                b = tf.cast(b, tf.bool)  # type: ignore
 
+        if _USE_XLA:
+            return self._tf_xla_call(operation, op_func, a, b)
         return op_func(a, b)
 
+    def _tf_xla_call(self, operation: str, op_func: Callable[..., Any], *args: tf.Tensor) -> tf.Tensor:
+        """Run an operation through its XLA-compiled function, falling back to eager."""
+        key = (operation,) + tuple((t.shape.rank, t.dtype) for t in args)
+        compiled = _XLA_FUNCTIONS.get(key)
+        try:
+            if compiled is None:
+                specs = [tf.TensorSpec(shape=[None] * t.shape.rank, dtype=t.dtype) for t in args]
+                compiled = tf.function(
+                    op_func, jit_compile=True, reduce_retracing=True
+                ).get_concrete_function(*specs)
+                _XLA_FUNCTIONS[key] = compiled
+                logger.debug("XLA trace built", operation=operation, traces=len(_XLA_FUNCTIONS))
+            return compiled(*args)
+        except (tf.errors.OpError, ValueError) as e:
+            # Tracing rejects bad shapes with ValueError; the eager re-run
+            # either succeeds or raises the op's own error
+            logger.debug("XLA execution failed, using eager", operation=operation, error=str(e))
+            return op_func(*args)
+
     def list_operations(self) -> Dict[str, List[str]]:
         """List all supported operations by category."""
         return {
-            "unary": sorted(UNARY_OPS),
-            "binary": sorted(BINARY_OPS),
+            "unary": list(_UNARY_OPS_SORTED),
+            "binary": list(_BINARY_OPS_SORTED),
         }
 
     def list_operations_tool(self) -> Dict[str, List[str]]:
@@ -6,10 +6,19 @@ discounted cash flows, and yield curve analysis.
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Tuple, cast
+import base64
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple, cast
 
 import numpy as np
 
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - numba is an optional extra
+    njit = None
+
 from app.logger import session_logger as logger
 from app.logger.decorators import log_execution_time
 from app.math_engine.base import MathCapability, MathResult, ToolDefinition
@@ -18,35 +27,353 @@ from app.exceptions import InvalidInputError
 import math
 
 
-def _nan_to_none(values: list) -> list:
-    """Convert NaN/Inf values to None for strict JSON compatibility.
+SERIES_FORMATS = ("list", "b64")
+
+
+def _series(values: np.ndarray, return_format: str = "list") -> List[Any] | str:
+    """Encode a 1-D float series for a JSON result.
+
+    "list" gives Python floats with NaN/Inf replaced by None, since strict
+    JSON (RFC 8259) has no NaN or Infinity; "b64" gives the raw
+    little-endian float64 buffer base64-encoded, NaN padding included,
+    without boxing every element.
+    """
+    if return_format == "b64":
+        raw = np.ascontiguousarray(values, dtype="<f8").tobytes()
+        return base64.b64encode(raw).decode("ascii")
+    out = values.tolist()
+    for i in np.flatnonzero(~np.isfinite(values)).tolist():
+        out[i] = None
+    return out
+
+
+def _check_series_format(return_format: str) -> None:
+    """Reject unknown series formats."""
+    if return_format not in SERIES_FORMATS:
+        raise InvalidInputError(
+            f"Unknown return_format: '{return_format}'. Supported: {list(SERIES_FORMATS)}"
+        )
+
+
+def _window_sums(values: np.ndarray, window: int) -> np.ndarray:
+    """Sums over every full window (np.convolve "valid" layout) from one cumulative sum.
 
-    MCP clients expect valid JSON (RFC 8259) which does not allow NaN/Inf.
-    Numpy arrays converted via .tolist() may still contain numpy scalar types
-    (np.float64, etc.), so we handle both Python and numpy numeric types.
+    O(n) regardless of window size. Callers centre the data first so the
+    running sum stays small and differencing it does not cancel digits.
     """
+    cs = np.empty(len(values) + 1)
+    cs[0] = 0.0
+    np.cumsum(values, out=cs[1:])
+    return cs[window:] - cs[:-window]
+
+
+def _norm_cdf(x: float) -> float:
+    return 0.5 * math.erfc(-x / math.sqrt(2.0))
 
-    sanitized: list = []
-    for v in values:
-        if isinstance(v, list):
-            sanitized.append(_nan_to_none(v))
-            continue
 
-        if isinstance(v, (np.integer,)):
-            sanitized.append(int(v))
-            continue
+def _norm_pdf(x: float) -> float:
+    return math.exp(-0.5 * x * x) / math.sqrt(2.0 * math.pi)
 
-        if isinstance(v, (float, np.floating)):
-            fv = float(v)
-            if math.isnan(fv) or math.isinf(fv):
-                sanitized.append(None)
+
+def _black_scholes(
+    S: float, K: float, T: float, r: float, q: float, sigma: float, option_type: str
+) -> Tuple[float, float, float, float, float, float]:
+    """Black-Scholes-Merton price and analytic Greeks for a European option.
+
+    Greeks use the binomial path's conventions: theta per day, vega and rho
+    per 1% move. Expects S, K, sigma and T all positive.
+    """
+    sqrt_t = math.sqrt(T)
+    d1 = (math.log(S / K) + (r - q + 0.5 * sigma * sigma) * T) / (sigma * sqrt_t)
+    d2 = d1 - sigma * sqrt_t
+    df_q = math.exp(-q * T)
+    df_r = math.exp(-r * T)
+    pdf_d1 = _norm_pdf(d1)
+    decay = -S * df_q * pdf_d1 * sigma / (2.0 * sqrt_t)
+
+    if option_type == "call":
+        n_d1 = _norm_cdf(d1)
+        n_d2 = _norm_cdf(d2)
+        price = S * df_q * n_d1 - K * df_r * n_d2
+        delta = df_q * n_d1
+        theta = decay - r * K * df_r * n_d2 + q * S * df_q * n_d1
+        rho = K * T * df_r * n_d2
+    else:
+        n_md1 = _norm_cdf(-d1)
+        n_md2 = _norm_cdf(-d2)
+        price = K * df_r * n_md2 - S * df_q * n_md1
+        delta = -df_q * n_md1
+        theta = decay + r * K * df_r * n_md2 - q * S * df_q * n_md1
+        rho = -K * T * df_r * n_md2
+
+    gamma = df_q * pdf_d1 / (S * sigma * sqrt_t)
+    vega = S * df_q * pdf_d1 * sqrt_t
+    return price, delta, gamma, theta / 365.0, vega * 0.01, rho * 0.01
+
+
+def _binomial_backward_numpy(
+    S_tree: float, K: float, log_u: float, p: float, discount: float,
+    is_call: bool, is_american: bool, N: int, pv_remaining: np.ndarray,
+) -> Tuple[float, float, float, float, float, float]:
+    """Backward induction over a CRR tree, one vectorized step per level.
+
+    Node (j, i) has price S_tree * u**(j - i) * d**i = S_tree * exp((j - 2i) * log_u)
+    since d = 1/u. The exponent only depends on j - 2i, so every level is a
+    shifted slice of level N (when N - j is even) or level N - 1 (when odd);
+    those two layers are the only exps evaluated.
+
+    Returns the root value followed by the node values at levels 1 and 2
+    (V10, V11, V20, V21, V22) used for the tree Greeks; nodes a shallow tree
+    does not have are 0.0.
+    """
+    S_even, S_odd = _binomial_layers(S_tree, log_u, N, is_american)
+    asset_prices = S_even
+    if is_call:
+        option_values = np.maximum(0, asset_prices - K)
+    else:
+        option_values = np.maximum(0, K - asset_prices)
+
+    # Fold the discount into the branch weights once
+    disc_p = discount * p
+    disc_1mp = discount * (1.0 - p)
+
+    nodes = [0.0] * 5
+    for j in range(N - 1, -1, -1):
+        continuation = disc_p * option_values[:-1] + disc_1mp * option_values[1:]
+
+        if is_american:
+            lattice = S_odd if (N - j) % 2 else S_even
+            offset = (N - j) // 2
+            S_current = lattice[offset:offset + j + 1] + pv_remaining[j]
+            if is_call:
+                intrinsic = np.maximum(0, S_current - K)
             else:
-                sanitized.append(fv)
-            continue
+                intrinsic = np.maximum(0, K - S_current)
+            option_values = np.maximum(continuation, intrinsic)
+        else:
+            option_values = continuation
+
+        if j == 2:
+            nodes[2:5] = option_values[:3].tolist()
+        elif j == 1:
+            nodes[0:2] = option_values[:2].tolist()
+
+    return (float(option_values[0]), *nodes)  # type: ignore[return-value]
+
+
+def _binomial_layers(
+    S_tree: float, log_u: float, N: int, with_odd: bool
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Asset prices at levels N and N - 1; the odd layer is empty unless requested."""
+    S_even = S_tree * np.exp((N - 2 * np.arange(N + 1)) * log_u)
+    if not with_odd:
+        return S_even, np.empty(0)
+    S_odd = S_tree * np.exp((N - 1 - 2 * np.arange(N)) * log_u)
+    return S_even, S_odd
+
+
+if njit is not None:
+    # Explicit signature compiles eagerly at import (loading from the on-disk
+    # cache after the first run), so the first price does not pay for the JIT.
+    _binomial_layers_nb = njit(
+        "UniTuple(float64[::1], 2)(float64, float64, int64, boolean)", cache=True, nogil=True
+    )(_binomial_layers)
+
+    @njit(
+        "UniTuple(float64, 6)(float64, float64, float64, float64, float64,"
+        " boolean, boolean, int64, float64[::1])",
+        cache=True,
+        fastmath=True,
+        nogil=True,
+    )
+    def _binomial_backward(
+        S_tree, K, log_u, p, discount, is_call, is_american, N, pv_remaining
+    ):  # pragma: no cover - compiled
+        """Backward induction over a CRR tree in one buffer, updated in place."""
+        S_even, S_odd = _binomial_layers_nb(S_tree, log_u, N, is_american)
+        vals = np.empty(N + 1)
+        for i in range(N + 1):
+            S = S_even[i]
+            vals[i] = max(0.0, S - K) if is_call else max(0.0, K - S)
+
+        # Fold the discount into the branch weights once
+        disc_p = discount * p
+        disc_1mp = discount * (1.0 - p)
+
+        v10 = v11 = v20 = v21 = v22 = 0.0
+        for j in range(N - 1, -1, -1):
+            lattice = S_odd if (N - j) % 2 else S_even
+            offset = (N - j) // 2
+            pv = pv_remaining[j] if is_american else 0.0
+            for i in range(j + 1):
+                v = disc_p * vals[i] + disc_1mp * vals[i + 1]
+                if is_american:
+                    S = lattice[offset + i] + pv
+                    intrinsic = max(0.0, S - K) if is_call else max(0.0, K - S)
+                    if intrinsic > v:
+                        v = intrinsic
+                vals[i] = v
+            if j == 2:
+                v20 = vals[0]
+                v21 = vals[1]
+                v22 = vals[2]
+            elif j == 1:
+                v10 = vals[0]
+                v11 = vals[1]
+        return vals[0], v10, v11, v20, v21, v22
+else:
+    _binomial_backward = _binomial_backward_numpy
+
+
+def _ema_recurrence_py(values: np.ndarray, alpha: float) -> np.ndarray:
+    """EMA seeded with the first value (pandas ewm(adjust=False))."""
+    out = np.empty(values.shape[0])
+    acc = values[0]
+    out[0] = acc
+    for i in range(1, values.shape[0]):
+        acc = alpha * values[i] + (1.0 - alpha) * acc
+        out[i] = acc
+    return out
+
+
+def _wilder_rsi_py(prices: np.ndarray, window: int) -> np.ndarray:
+    """RSI with Wilder's smoothing (RMA), in one pass over the prices.
+
+    Average gain and loss are running scalars seeded with the mean of the
+    first window of deltas, so the only array written is the output. Index
+    i < window is NaN; RSI is 100 while the average loss is zero.
+    """
+    n = prices.shape[0]
+    out = np.empty(n)
+    ag = 0.0
+    al = 0.0
+    for i in range(1, n):
+        delta = prices[i] - prices[i - 1]
+        gain = delta if delta > 0.0 else 0.0
+        loss = -delta if delta < 0.0 else 0.0
+        if i <= window:
+            ag += gain
+            al += loss
+            if i < window:
+                continue
+            ag /= window
+            al /= window
+        else:
+            ag = (ag * (window - 1) + gain) / window
+            al = (al * (window - 1) + loss) / window
+        out[i] = 100.0 - 100.0 / (1.0 + ag / al) if al > 0.0 else 100.0
+    out[:window] = np.nan
+    return out
 
-        sanitized.append(v)
 
-    return sanitized
+def _macd_py(
+    prices: np.ndarray, a_fast: float, a_slow: float, a_signal: float
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """MACD line, signal line and histogram in one pass over the prices.
+
+    The fast, slow and signal EMAs (each seeded with its first input, like
+    _ema_recurrence) are running scalars, so only the outputs are stored.
+    """
+    n = prices.shape[0]
+    macd = np.empty(n)
+    signal = np.empty(n)
+    hist = np.empty(n)
+    ef = prices[0]
+    es = prices[0]
+    sig = 0.0
+    for i in range(n):
+        x = prices[i]
+        ef = a_fast * x + (1.0 - a_fast) * ef
+        es = a_slow * x + (1.0 - a_slow) * es
+        m = ef - es
+        sig = m if i == 0 else a_signal * m + (1.0 - a_signal) * sig
+        macd[i] = m
+        signal[i] = sig
+        hist[i] = m - sig
+    return macd, signal, hist
+
+
+def _rolling_mean_std_py(values: np.ndarray, window: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Mean and population std of every full window (np.convolve "valid" layout).
+
+    Welford's update, sliding: each step adds the new value and removes the
+    oldest, so the error follows the spread inside the window rather than the
+    size of a running total. Every window-th window is re-seeded with an exact
+    two-pass sum so rounding in the running mean cannot drift along a trend,
+    and a window of identical values reports a std of exactly 0.
+    """
+    n = values.shape[0]
+    means = np.empty(n - window + 1)
+    stds = np.empty(n - window + 1)
+    mean = 0.0
+    m2 = 0.0
+    run = 1
+    for i in range(1, window):
+        run = run + 1 if values[i] == values[i - 1] else 1
+    for i in range(window - 1, n):
+        k = i - window + 1
+        x = values[i]
+        if k > 0:
+            run = run + 1 if x == values[i - 1] else 1
+        if k % window == 0:
+            mean = 0.0
+            for j in range(k, i + 1):
+                mean += values[j]
+            mean /= window
+            m2 = 0.0
+            for j in range(k, i + 1):
+                d = values[j] - mean
+                m2 += d * d
+        else:
+            old = values[k - 1]
+            prev_mean = mean
+            mean += (x - old) / window
+            m2 += (x - old) * (x - mean + old - prev_mean)
+        if run >= window:
+            mean = x
+            m2 = 0.0
+        means[k] = mean
+        stds[k] = math.sqrt(m2 / window) if m2 > 0.0 else 0.0
+    return means, stds
+
+
+if njit is not None:
+    # The same loops, compiled; they are sequential recurrences NumPy cannot vectorize
+    _ema_recurrence = njit("float64[::1](float64[::1], float64)", cache=True, fastmath=True)(
+        _ema_recurrence_py
+    )
+    # No fastmath here: the output carries NaN padding
+    _wilder_rsi = njit("float64[::1](float64[::1], int64)", cache=True)(_wilder_rsi_py)
+    _macd = njit(
+        "UniTuple(float64[::1], 3)(float64[::1], float64, float64, float64)",
+        cache=True,
+        fastmath=True,
+    )(_macd_py)
+    # No fastmath: reassociating the add/remove update defeats it
+    _rolling_mean_std = njit(
+        "UniTuple(float64[::1], 2)(float64[::1], int64)", cache=True
+    )(_rolling_mean_std_py)
+else:
+    _ema_recurrence = _ema_recurrence_py
+    _wilder_rsi = _wilder_rsi_py
+    _macd = _macd_py
+    _rolling_mean_std = _rolling_mean_std_py
+
+# The base tree and the vega/rho bumps are independent. The compiled kernel
+# releases the GIL, so on multi-core hosts deep trees run side by side.
+PARALLEL_TREE_MIN_STEPS = 200
+_PARALLEL_TREES = njit is not None and (os.cpu_count() or 1) > 1
+_tree_pool: Optional[ThreadPoolExecutor] = None
+_TREE_POOL_LOCK = threading.Lock()
+
+
+def _get_tree_pool() -> ThreadPoolExecutor:
+    """Return the shared pool for binomial tree evaluations, creating it on first use."""
+    global _tree_pool
+    with _TREE_POOL_LOCK:
+        if _tree_pool is None:
+            _tree_pool = ThreadPoolExecutor(max_workers=3, thread_name_prefix="gofrnp-tree")
+        return _tree_pool
 
 
 class FinancialCapability(MathCapability):
@@ -72,7 +399,8 @@ class FinancialCapability(MathCapability):
                         "cash_flows": {"type": "array", "items": {"type": "number"}, "description": "List of cash flow amounts"},
                         "rate": {"description": "Discount rate (scalar) or yield curve (array)", "anyOf": [{"type": "number"}, {"type": "array", "items": {"type": "number"}}]},
                         "times": {"type": "array", "items": {"type": "number"}, "description": "Time periods for cash flows (optional, defaults to 1..N)"},
-                        "compounding": {"type": "string", "enum": ["discrete", "continuous"], "default": "discrete"}
+                        "compounding": {"type": "string", "enum": ["discrete", "continuous"], "default": "discrete"},
+                        "return_format": {"type": "string", "enum": list(SERIES_FORMATS), "default": "list", "description": "'list' for JSON arrays, 'b64' for each array as base64 little-endian float64 (decode with np.frombuffer(base64.b64decode(s), '<f8')); use 'b64' for long series"}
                     },
                     "required": ["cash_flows", "rate"]
                 },
@@ -94,7 +422,7 @@ class FinancialCapability(MathCapability):
             ),
             ToolDefinition(
                 name="financial_option_price",
-                description="Calculate option price and Greeks using Binomial Tree (CRR) model.",
+                description="Calculate option price and Greeks using a Binomial Tree (CRR) or, for European options, the Black-Scholes closed form.",
                 input_schema={
                     "type": "object",
                     "properties": {
@@ -106,6 +434,7 @@ class FinancialCapability(MathCapability):
                         "option_type": {"type": "string", "enum": ["call", "put"]},
                         "exercise_style": {"type": "string", "enum": ["european", "american"]},
                         "steps": {"type": "integer", "default": 100, "description": "Number of steps in binomial tree"},
+                        "model": {"type": "string", "enum": ["binomial", "black_scholes"], "default": "binomial", "description": "Pricing model. 'black_scholes' is closed form (European exercise, no discrete dividends) with analytic Greeks; 'binomial' handles every case"},
                         "q": {"type": "number", "default": 0.0, "description": "Dividend yield"},
                         "dividends": {
                             "type": "array", 
@@ -145,7 +474,8 @@ class FinancialCapability(MathCapability):
                     "properties": {
                         "indicator": {"type": "string", "enum": ["sma", "ema", "rsi", "pe_ratio"]},
                         "prices": {"type": "array", "items": {"type": "number"}, "description": "Historical price data"},
-                        "params": {"type": "object", "description": "Indicator-specific parameters (e.g., window)"}
+                        "params": {"type": "object", "description": "Indicator-specific parameters (e.g., window)"},
+                        "return_format": {"type": "string", "enum": list(SERIES_FORMATS), "default": "list", "description": "'list' for JSON arrays (NaN padding as null), 'b64' for each series as base64 little-endian float64 with NaN padding kept; use 'b64' for long series"}
                     },
                     "required": ["indicator"]
                 },
@@ -155,23 +485,22 @@ class FinancialCapability(MathCapability):
 
     def __init__(self):
         """Initialize the financial capability."""
+        self._dispatch: Dict[str, Callable[[Dict[str, Any]], MathResult]] = {
+            "financial_pv": self.handle_pv,
+            "financial_convert_rate": self.handle_convert_rate,
+            "financial_option_price": self.handle_option_price,
+            "financial_bond_price": self.handle_bond_price,
+            "financial_technical_indicators": self.handle_technical_indicators,
+        }
         logger.info("FinancialCapability initialized")
 
     @log_execution_time
     def handle(self, tool_name: str, arguments: Dict[str, Any]) -> MathResult:
         """Route tool invocation to appropriate handler."""
-        if tool_name == "financial_pv":
-            return self.handle_pv(arguments)
-        elif tool_name == "financial_convert_rate":
-            return self.handle_convert_rate(arguments)
-        elif tool_name == "financial_option_price":
-            return self.handle_option_price(arguments)
-        elif tool_name == "financial_bond_price":
-            return self.handle_bond_price(arguments)
-        elif tool_name == "financial_technical_indicators":
-            return self.handle_technical_indicators(arguments)
-        else:
+        handler = self._dispatch.get(tool_name)
+        if handler is None:
             raise InvalidInputError(f"Unknown tool: {tool_name}")
+        return handler(arguments)
 
     def _get_frequency(self, freq_str: str) -> float:
         """Convert frequency string to number of periods per year."""
@@ -239,9 +568,11 @@ class FinancialCapability(MathCapability):
         rate = arguments.get("rate")
         times = arguments.get("times")
         compounding = arguments.get("compounding", "discrete")
+        return_format = arguments.get("return_format", "list")
 
         if cash_flows is None or rate is None:
             raise InvalidInputError("cash_flows and rate are required")
+        _check_series_format(return_format)
 
         # Convert to numpy arrays
         cf = np.array(cash_flows, dtype=np.float64)
@@ -270,8 +601,11 @@ class FinancialCapability(MathCapability):
             # DF = e^(-r*t)
             df = np.exp(-r * t)
         else:
-            # Discrete: DF = 1 / (1 + r)^t
-            df = 1.0 / np.power(1.0 + r, t)
+            # Discrete: DF = 1 / (1 + r)^t = exp(-t * log1p(r)); log1p stays
+            # accurate for small r and the log is taken once for a scalar rate
+            if np.any(np.asarray(r) <= -1.0):
+                raise InvalidInputError("Rate must be greater than -1.0 (-100%) for discrete compounding")
+            df = np.exp(-t * np.log1p(r))
 
         # Calculate PVs
         discounted_flows = cf * df
@@ -280,10 +614,10 @@ class FinancialCapability(MathCapability):
         return MathResult(
             result={
                 "present_value": float(total_pv),
-                "discounted_flows": discounted_flows.tolist(),
+                "discounted_flows": _series(discounted_flows, return_format),
                 "total_undiscounted": float(np.sum(cf)),
-                "effective_rates": r.tolist() if isinstance(r, np.ndarray) else [r] * n,
-                "times": t.tolist()
+                "effective_rates": _series(np.broadcast_to(r, (n,)), return_format),
+                "times": _series(t, return_format)
             },
             shape=[],
             dtype="object"
@@ -310,75 +644,45 @@ class FinancialCapability(MathCapability):
 
         # 1. Setup Tree Parameters
         dt = T / N
-        u = np.exp(sigma * np.sqrt(dt))
+        log_u = sigma * math.sqrt(dt)
+        u = np.exp(log_u)
         d = 1 / u
         p = (np.exp((r - q) * dt) - d) / (u - d)
         discount = np.exp(-r * dt)
 
-        # 2. Initialize Asset Prices at Maturity
-        i_vals = np.arange(N + 1)
-        tree_prices = S_tree * (u ** (N - i_vals)) * (d ** i_vals)
-        asset_prices = tree_prices
-
-        # 3. Initialize Option Values at Maturity
-        if option_type == "call":
-            option_values = np.maximum(0, asset_prices - K)
+        # 2. PV of dividends still to be paid at each level, as of that level.
+        # One (levels x dividends) pass. American exercise reads every level;
+        # otherwise only levels 1 and 2 are needed, for the Greeks.
+        n_levels = max(N, 2) + 1 if style == "american" else 3
+        if valid_divs:
+            div_amounts = np.array([div["amount"] for div in valid_divs], dtype=np.float64)
+            div_times = np.array([div["time"] for div in valid_divs], dtype=np.float64)
+            t_grid = np.arange(n_levels) * dt
+            pending = div_times[None, :] > t_grid[:, None]
+            pv = div_amounts[None, :] * np.exp(-r * (div_times[None, :] - t_grid[:, None]))
+            pv_remaining = np.where(pending, pv, 0.0).sum(axis=1)
         else:
-            option_values = np.maximum(0, K - asset_prices)
-
-        # 4. Backward Induction
-        val_node_1_0 = 0.0
-        val_node_1_1 = 0.0
-        val_node_2_0 = 0.0
-        val_node_2_1 = 0.0
-        val_node_2_2 = 0.0
-
-        for j in range(N - 1, -1, -1):
-            t_current = j * dt
-            pv_remaining = sum(
-                div["amount"] * np.exp(-r * (div["time"] - t_current))
-                for div in valid_divs if div["time"] > t_current
-            )
-
-            continuation = discount * (p * option_values[:-1] + (1 - p) * option_values[1:])
-            
-            if style == "american":
-                i_current = np.arange(j + 1)
-                S_tree_current = S_tree * (u ** (j - i_current)) * (d ** i_current)
-                S_current = S_tree_current + pv_remaining
-                
-                if option_type == "call":
-                    intrinsic = np.maximum(0, S_current - K)
-                else:
-                    intrinsic = np.maximum(0, K - S_current)
-                option_values = np.maximum(continuation, intrinsic)
-            else:
-                option_values = continuation
-            
-            if return_greeks:
-                if j == 2:
-                    val_node_2_0 = option_values[0]
-                    val_node_2_1 = option_values[1]
-                    val_node_2_2 = option_values[2]
-                elif j == 1:
-                    val_node_1_0 = option_values[0]
-                    val_node_1_1 = option_values[1]
-
-        price = option_values[0]
+            pv_remaining = np.zeros(n_levels)
+
+        # 3. Backward Induction from the payoff at maturity
+        (
+            price, val_node_1_0, val_node_1_1, val_node_2_0, val_node_2_1, val_node_2_2
+        ) = _binomial_backward(
+            float(S_tree), K, log_u, float(p), float(discount),
+            option_type == "call", style == "american", N, pv_remaining,
+        )
 
         if not return_greeks:
             return price
 
         # Calculate Tree Greeks (Delta, Gamma, Theta)
-        t_1 = 1 * dt
-        pv_rem_1 = sum(d["amount"] * np.exp(-r * (d["time"] - t_1)) for d in valid_divs if d["time"] > t_1)
+        pv_rem_1 = pv_remaining[1]
         S_u = (S_tree * u) + pv_rem_1
         S_d = (S_tree * d) + pv_rem_1
         
         delta = (val_node_1_0 - val_node_1_1) / (S_u - S_d)
 
-        t_2 = 2 * dt
-        pv_rem_2 = sum(d["amount"] * np.exp(-r * (d["time"] - t_2)) for d in valid_divs if d["time"] > t_2)
+        pv_rem_2 = pv_remaining[2]
         S_uu = (S_tree * u * u) + pv_rem_2
         S_ud = (S_tree) + pv_rem_2
         S_dd = (S_tree * d * d) + pv_rem_2
@@ -395,7 +699,7 @@ class FinancialCapability(MathCapability):
         return price, delta, gamma, theta_daily
 
     def handle_option_price(self, arguments: Dict[str, Any]) -> MathResult:
-        """Calculate option price using Binomial Tree."""
+        """Calculate option price using Binomial Tree or Black-Scholes."""
         S = float(arguments["S"])
         K = float(arguments["K"])
         T = float(arguments["T"])
@@ -406,6 +710,7 @@ class FinancialCapability(MathCapability):
         option_type = arguments["option_type"].lower()
         style = arguments["exercise_style"].lower()
         N = int(arguments.get("steps", 100))
+        model = str(arguments.get("model", "binomial")).lower()
 
         if S < 0:
             raise InvalidInputError("Spot price (S) must be non-negative")
@@ -415,36 +720,45 @@ class FinancialCapability(MathCapability):
             raise InvalidInputError("Volatility (sigma) must be non-negative")
         if N < 1:
             raise InvalidInputError("Steps must be at least 1")
+        if model == "black_scholes":
+            return self._black_scholes_result(S, K, T, r, q, dividends, sigma, option_type, style)
+        if model != "binomial":
+            raise InvalidInputError(f"Unknown model: {model}. Supported: ['binomial', 'black_scholes']")
 
-        # 1. Base Calculation (Price + Tree Greeks)
-        result_tuple = self._calculate_binomial_price(
-            S, K, T, r, q, dividends, sigma, option_type, style, N, return_greeks=True
-        )
-        # Cast to tuple to satisfy type checker (it can't infer return type from bool arg)
-        price, delta, gamma, theta = cast(Tuple[float, float, float, float], result_tuple)
-
-        # 2. Vega (Bump Sigma)
         # dSigma = 1% relative or absolute? Usually absolute 0.01 or 0.0001.
         # Let's use 0.001 (0.1%)
         d_sigma = 0.001
-        price_bump_sigma = self._calculate_binomial_price(
-            S, K, T, r, q, dividends, sigma + d_sigma, option_type, style, N, return_greeks=False
-        )
-        # Ensure price_bump_sigma is a float
+        d_r = 0.001
+        base_args = (S, K, T, r, q, dividends, sigma, option_type, style, N)
+        sigma_args = (S, K, T, r, q, dividends, sigma + d_sigma, option_type, style, N)
+        r_args = (S, K, T, r + d_r, q, dividends, sigma, option_type, style, N)
+
+        if _PARALLEL_TREES and N >= PARALLEL_TREE_MIN_STEPS:
+            pool = _get_tree_pool()
+            base_future = pool.submit(self._calculate_binomial_price, *base_args, return_greeks=True)
+            sigma_future = pool.submit(self._calculate_binomial_price, *sigma_args)
+            r_future = pool.submit(self._calculate_binomial_price, *r_args)
+            result_tuple = base_future.result()
+            price_bump_sigma = sigma_future.result()
+            price_bump_r = r_future.result()
+        else:
+            # 1. Base Calculation (Price + Tree Greeks)
+            result_tuple = self._calculate_binomial_price(*base_args, return_greeks=True)
+            # 2. Vega (Bump Sigma)
+            price_bump_sigma = self._calculate_binomial_price(*sigma_args)
+            # 3. Rho (Bump r)
+            price_bump_r = self._calculate_binomial_price(*r_args)
+
+        # Cast to tuple to satisfy type checker (it can't infer return type from bool arg)
+        price, delta, gamma, theta = cast(Tuple[float, float, float, float], result_tuple)
+
+        # Ensure bumped prices are floats
         if isinstance(price_bump_sigma, tuple):
             price_bump_sigma = price_bump_sigma[0]
-            
-        vega = (price_bump_sigma - price) / d_sigma * 0.01 # Scaled to 1% change
-
-        # 3. Rho (Bump r)
-        d_r = 0.001
-        price_bump_r = self._calculate_binomial_price(
-            S, K, T, r + d_r, q, dividends, sigma, option_type, style, N, return_greeks=False
-        )
-        # Ensure price_bump_r is a float
         if isinstance(price_bump_r, tuple):
             price_bump_r = price_bump_r[0]
-            
+
+        vega = (price_bump_sigma - price) / d_sigma * 0.01 # Scaled to 1% change
         rho = (price_bump_r - price) / d_r * 0.01 # Scaled to 1% change
 
         return MathResult(
@@ -462,6 +776,41 @@ class FinancialCapability(MathCapability):
             dtype="object"
         )
 
+    def _black_scholes_result(
+        self, S, K, T, r, q, dividends, sigma, option_type, style
+    ) -> MathResult:
+        """Price a European option in closed form, O(1) instead of three trees."""
+        if style != "european":
+            raise InvalidInputError("Black-Scholes model prices European exercise only")
+        if dividends:
+            raise InvalidInputError(
+                "Black-Scholes model does not take discrete dividends; use the binomial model"
+            )
+        if S <= 0 or K <= 0 or sigma <= 0:
+            raise InvalidInputError("Black-Scholes model requires positive S, K and sigma")
+
+        if T <= 0:
+            payoff = max(0.0, S - K) if option_type == "call" else max(0.0, K - S)
+            price, delta, gamma, theta, vega, rho = payoff, 0.0, 0.0, 0.0, 0.0, 0.0
+        else:
+            price, delta, gamma, theta, vega, rho = _black_scholes(
+                S, K, T, r, q, sigma, option_type
+            )
+
+        return MathResult(
+            result={
+                "price": price,
+                "delta": delta,
+                "gamma": gamma,
+                "theta": theta,
+                "vega": vega,
+                "rho": rho,
+                "model": "Black-Scholes"
+            },
+            shape=[],
+            dtype="object"
+        )
+
     def handle_bond_price(self, arguments: Dict[str, Any]) -> MathResult:
         """Calculate bond price and risk metrics."""
         face_value = float(arguments.get("face_value", 100.0))
@@ -490,7 +839,7 @@ class FinancialCapability(MathCapability):
         t = np.arange(1, n_periods + 1, dtype=np.float64)
 
         # Discount factors: 1 / (1+r)^t
-        df = 1.0 / np.power(1.0 + r, t)
+        df = np.exp(-t * math.log1p(r))
 
         # Cash flows: Coupons
         cash_flows = np.full(n_periods, c)
@@ -516,7 +865,7 @@ class FinancialCapability(MathCapability):
         # C = (1 / (Price * (1+r)^2)) * sum(t*(t+1) * CF / (1+r)^t) / frequency^2
         # t is period number
         convexity_term = t * (t + 1) * pv_flows
-        convexity = (np.sum(convexity_term) / (price * np.power(1.0 + r, 2))) / (frequency * frequency)
+        convexity = (np.sum(convexity_term) / (price * (1.0 + r) ** 2)) / (frequency * frequency)
 
         return MathResult(
             result={
@@ -537,6 +886,8 @@ class FinancialCapability(MathCapability):
         indicator = arguments.get("indicator")
         prices_list = arguments.get("prices", [])
         params = arguments.get("params", {})
+        return_format = arguments.get("return_format", "list")
+        _check_series_format(return_format)
 
         if indicator == "pe_ratio":
             price = params.get("price")
@@ -568,15 +919,15 @@ class FinancialCapability(MathCapability):
                 raise InvalidInputError(f"Not enough data for SMA (window={window}, data={n})")
             
             # Simple Moving Average
-            weights = np.ones(window) / window
-            sma = np.convolve(prices, weights, mode="valid")
+            centre = prices.mean()
+            sma = _window_sums(prices - centre, window) / window + centre
             # Pad with NaNs or just return valid? Let's return valid and metadata about offset
             # To match length, we can prepend NaNs
             full_sma = np.full(n, np.nan)
             full_sma[window-1:] = sma
             
             return MathResult({
-                "values": _nan_to_none(full_sma.tolist()),
+                "values": _series(full_sma, return_format),
                 "indicator": "sma",
                 "window": window
             }, [], "object")
@@ -591,19 +942,14 @@ class FinancialCapability(MathCapability):
             # Exponential Moving Average
             # alpha = 2 / (N + 1)
             alpha = 2.0 / (window + 1.0)
-            ema = np.zeros_like(prices)
-            ema[0] = prices[0] # Seed with first price (or SMA of first N)
+            # Seed with first price (or SMA of first N)
             # Better to seed with SMA of first window? Standard is usually SMA of first window.
             # Let's stick to simple recursive for now or pandas-like ewm.
             # Pandas ewm(adjust=False)
-            
-            # Vectorized EMA is hard, iterative is fine for reasonable N
-            ema[0] = prices[0]
-            for i in range(1, n):
-                ema[i] = alpha * prices[i] + (1 - alpha) * ema[i-1]
+            ema = _ema_recurrence(prices, alpha)
                 
             return MathResult({
-                "values": ema.tolist(),
+                "values": _series(ema, return_format),
                 "indicator": "ema",
                 "window": window
             }, [], "object")
@@ -615,39 +961,13 @@ class FinancialCapability(MathCapability):
             if n < window + 1:
                 raise InvalidInputError(f"Not enough data for RSI (window={window}, data={n})")
             
-            deltas = np.diff(prices)
-            gains = np.maximum(deltas, 0.0)
-            losses = -np.minimum(deltas, 0.0)
-            
             # Wilder's Smoothing (RMA) is standard for RSI, which is EMA(alpha=1/N)
             # Not standard EMA(alpha=2/(N+1))
-            alpha = 1.0 / window
-            
-            avg_gain = np.zeros(n)
-            avg_loss = np.zeros(n)
-            
-            # Initial average
-            avg_gain[window] = np.mean(gains[:window])
-            avg_loss[window] = np.mean(losses[:window])
-            
-            for i in range(window + 1, n):
-                avg_gain[i] = (avg_gain[i-1] * (window - 1) + gains[i-1]) / window
-                avg_loss[i] = (avg_loss[i-1] * (window - 1) + losses[i-1]) / window
-                
-            rs = np.zeros(n)
-            rsi = np.zeros(n)
-            
-            # Avoid division by zero
-            mask = avg_loss > 0
-            rs[mask] = avg_gain[mask] / avg_loss[mask]
-            rsi[mask] = 100.0 - (100.0 / (1.0 + rs[mask]))
-            rsi[~mask] = 100.0 # If loss is 0, RSI is 100
-            
-            # First 'window' elements are invalid
-            rsi[:window] = np.nan
+            # If loss is 0, RSI is 100; the first 'window' elements are invalid
+            rsi = _wilder_rsi(prices, window)
             
             return MathResult({
-                "values": _nan_to_none(rsi.tolist()),
+                "values": _series(rsi, return_format),
                 "indicator": "rsi",
                 "window": window
             }, [], "object")
@@ -657,25 +977,15 @@ class FinancialCapability(MathCapability):
             slow = int(params.get("slow", 26))
             signal = int(params.get("signal", 9))
             
-            # Helper for EMA
-            def calc_ema(data, span):
-                alpha = 2.0 / (span + 1.0)
-                res = np.zeros_like(data)
-                res[0] = data[0]
-                for i in range(1, len(data)):
-                    res[i] = alpha * data[i] + (1 - alpha) * res[i-1]
-                return res
-            
-            ema_fast = calc_ema(prices, fast)
-            ema_slow = calc_ema(prices, slow)
-            macd_line = ema_fast - ema_slow
-            signal_line = calc_ema(macd_line, signal)
-            histogram = macd_line - signal_line
+            # Fast/slow EMAs, their difference and its signal EMA in one pass
+            macd_line, signal_line, histogram = _macd(
+                prices, 2.0 / (fast + 1.0), 2.0 / (slow + 1.0), 2.0 / (signal + 1.0)
+            )
             
             return MathResult({
-                "macd": macd_line.tolist(),
-                "signal": signal_line.tolist(),
-                "histogram": histogram.tolist(),
+                "macd": _series(macd_line, return_format),
+                "signal": _series(signal_line, return_format),
+                "histogram": _series(histogram, return_format),
                 "indicator": "macd"
             }, [], "object")
 
@@ -688,17 +998,8 @@ class FinancialCapability(MathCapability):
             if n < window:
                 raise InvalidInputError("Not enough data for Bollinger Bands")
             
-            # SMA
-            weights = np.ones(window) / window
-            sma = np.convolve(prices, weights, mode="valid")
-            
-            # Rolling Std Dev
-            # Efficient rolling std dev?
-            # std[i] = sqrt(mean(x^2) - mean(x)^2)
-            # Or just loop
-            rolling_std = np.zeros(n - window + 1)
-            for i in range(len(rolling_std)):
-                rolling_std[i] = np.std(prices[i:i+window])
+            # SMA and rolling (population) std dev in one sliding pass
+            sma, rolling_std = _rolling_mean_std(prices, window)
             
             # Pad
             full_sma = np.full(n, np.nan)
@@ -711,9 +1012,9 @@ class FinancialCapability(MathCapability):
             full_lower[window-1:] = sma - num_std * rolling_std
             
             return MathResult({
-                "middle_band": _nan_to_none(full_sma.tolist()),
-                "upper_band": _nan_to_none(full_upper.tolist()),
-                "lower_band": _nan_to_none(full_lower.tolist()),
+                "middle_band": _series(full_sma, return_format),
+                "upper_band": _series(full_upper, return_format),
+                "lower_band": _series(full_lower, return_format),
                 "indicator": "bollinger"
             }, [], "object")
 
@@ -721,13 +1022,16 @@ class FinancialCapability(MathCapability):
             short_w = int(params.get("short_window", 50))
             long_w = int(params.get("long_window", 200))
             
+            if short_w <= 0 or long_w <= 0:
+                raise InvalidInputError("Windows must be positive")
             if n < long_w:
                 raise InvalidInputError("Not enough data for Cross Signal")
             
             # Calculate SMAs
+            centre = prices.mean()
+
             def get_sma(data, w):
-                weights = np.ones(w) / w
-                res = np.convolve(data, weights, mode="valid")
+                res = _window_sums(data - centre, w) / w + centre
                 padded = np.full(len(data), np.nan)
                 padded[w-1:] = res
                 return padded
@@ -30,6 +30,8 @@ class ToolRegistry:
         self._capabilities: Dict[str, MathCapability] = {}
         self._tool_to_capability: Dict[str, str] = {}
         self._tools: Dict[str, ToolDefinition] = {}
+        # MCP Tool objects for list_tools(); rebuilt only after a registration
+        self._mcp_tools: Optional[List[Tool]] = None
         logger.info("ToolRegistry initialized")
 
     def register_capability(self, capability: MathCapability) -> None:
@@ -49,8 +51,11 @@ class ToolRegistry:
         # Register capability
         self._capabilities[cap_name] = capability
 
-        # Register all tools from this capability
-        for tool_def in capability.get_tools():
+        # Register all tools from this capability; drop the cached MCP list
+        # first so a duplicate-name failure part way through cannot leave it stale
+        self._mcp_tools = None
+        tool_defs = capability.get_tools()
+        for tool_def in tool_defs:
             if tool_def.name in self._tools:
                 existing_cap = self._tool_to_capability[tool_def.name]
                 raise ValueError(
@@ -63,27 +68,29 @@ class ToolRegistry:
         logger.info(
             "Capability registered",
             capability=cap_name,
-            tools=[t.name for t in capability.get_tools()],
+            tools=[t.name for t in tool_defs],
         )
 
     def get_mcp_tools(self) -> List[Tool]:
         """Get all registered tools as MCP Tool objects.
 
+        The Tool objects are built once and reused until another capability
+        is registered; each call returns a fresh list.
+
         Returns:
             List of MCP Tool objects ready for list_tools() response
         """
-        mcp_tools = []
-
-        for tool_def in self._tools.values():
-            mcp_tools.append(
+        if self._mcp_tools is None:
+            self._mcp_tools = [
                 Tool(
                     name=tool_def.name,
                     description=tool_def.description,
                     inputSchema=tool_def.input_schema,
                 )
-            )
+                for tool_def in self._tools.values()
+            ]
 
-        return mcp_tools
+        return list(self._mcp_tools)
 
     def get_tool_names(self) -> List[str]:
         """Get list of all registered tool names."""
@@ -86,7 +86,8 @@ class MCPOWrapper:
 
         mode = "authenticated" if self.use_auth else "public (no auth)"
         logger.info(
-            f"Starting MCPO wrapper in {mode} mode",
+            "Starting MCPO wrapper in %s mode",
+            mode,
             mcp_url=f"http://{self.mcp_host}:{self.mcp_port}/mcp",
             mcpo_host=self.mcpo_host,
             mcpo_port=self.mcpo_port,
@@ -13,10 +13,10 @@ from __future__ import annotations
 import os
 from typing import Optional, Tuple
 
-from gofr_common.auth.backends import create_vault_client_from_env
 from gofr_common.auth.jwt_secret_provider import JwtSecretProvider
 from gofr_common.logger import Logger
 
+from app.auth.factory import get_vault_client
 from app.config import Config
 
 
@@ -85,7 +85,7 @@ def resolve_auth_config(
         )
 
         try:
-            vault_client = create_vault_client_from_env(vault_prefix, logger=logger)
+            vault_client = get_vault_client(vault_prefix, logger=logger)
             provider = JwtSecretProvider(
                 vault_client=vault_client,
                 vault_path=resolved_vault_path,
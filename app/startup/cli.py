@@ -0,0 +1,51 @@
+"""Command line arguments shared by the GOFRNP server entry points."""
+
+import argparse
+import os
+
+
+def common_parser(port_env: str, default_port: int) -> argparse.ArgumentParser:
+    """
+    Build the parent parser holding the host, port and auth flags.
+
+    Entry points pass the result via ``argparse.ArgumentParser(parents=[...])``
+    and add only their own flags on top.
+
+    Args:
+        port_env: Environment variable that overrides the default port
+        default_port: Port used when the environment variable is unset
+
+    Returns:
+        ArgumentParser created with add_help=False, suitable as a parent
+    """
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument(
+        "--host",
+        type=str,
+        default="0.0.0.0",
+        help="Host address to bind to (default: 0.0.0.0)",
+    )
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=int(os.environ.get(port_env, str(default_port))),
+        help=f"Port number to listen on (default: {default_port}, or {port_env} env var)",
+    )
+    parser.add_argument(
+        "--jwt-secret",
+        type=str,
+        default=None,
+        help="DEPRECATED: JWT secret is sourced from Vault via gofr-common (ignored)",
+    )
+    parser.add_argument(
+        "--token-store",
+        type=str,
+        default=None,
+        help="DEPRECATED: token store is Vault-backed via gofr-common (ignored)",
+    )
+    parser.add_argument(
+        "--no-auth",
+        action="store_true",
+        help="Disable authentication (WARNING: insecure, for development only)",
+    )
+    return parser
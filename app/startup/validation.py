@@ -1,6 +1,7 @@
 """Server startup validation and initialization utilities."""
 
-from typing import List
+import os
+from typing import List, Optional
 from app.config import Config
 from app.logger import Logger
 
@@ -70,3 +71,26 @@ def validate_data_directory_structure(logger: Logger) -> None:
         path=str(data_dir),
         subdirectories=[d[0] for d in required_dirs],
     )
+
+
+def validate_log_file(path: Optional[str]) -> None:
+    """
+    Check up front that the configured log file can be written.
+
+    Args:
+        path: Log file path (GOFRNP_LOG_FILE); None or empty skips the check
+
+    Raises:
+        RuntimeError: If the file or its parent directory is not writable
+    """
+    if not path:
+        return
+
+    if os.path.exists(path):
+        if not os.path.isfile(path) or not os.access(path, os.W_OK):
+            raise RuntimeError(f"Log file is not writable: {path}")
+        return
+
+    parent = os.path.dirname(os.path.abspath(path))
+    if not os.path.isdir(parent) or not os.access(parent, os.W_OK):
+        raise RuntimeError(f"Log file directory is not writable: {parent}")
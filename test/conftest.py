@@ -8,9 +8,22 @@ import pytest
 
 # Add project root to sys.path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
+
+# Unbuffered console logging, so records land in the test that wrote them
+os.environ["GOFRNP_LOG_BUFFER_SIZE"] = "0"
+
 from app.config import Config
 
 
+def pytest_sessionfinish(session, exitstatus):
+    """Write out any buffered log records before pytest reports."""
+    from app.logger import session_logger
+
+    flush = getattr(session_logger, "flush", None)
+    if flush is not None:
+        flush()
+
+
 @pytest.fixture(scope="function", autouse=True)
 def test_data_dir(tmp_path):
     """
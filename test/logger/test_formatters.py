@@ -0,0 +1,61 @@
+"""Tests for the structured logger formatters."""
+
+import json
+import logging
+
+import pytest
+
+from app.logger.structured_logger import JsonFormatter, StructuredLogger, TextFormatter
+
+
+class _Collect(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+@pytest.fixture
+def records():
+    """Records emitted through a StructuredLogger named test-formatters."""
+    structured = StructuredLogger(name="test-formatters")
+    handler = _Collect()
+    logging.getLogger("test-formatters").addHandler(handler)
+    yield structured, handler.records
+    logging.getLogger("test-formatters").removeHandler(handler)
+
+
+def _stdlib_record(**extra):
+    logger = logging.getLogger("test-formatters-stdlib")
+    return logger.makeRecord(
+        logger.name, logging.INFO, __file__, 1, "hello", (), None, extra=dict(extra)
+    )
+
+
+class TestFormatters:
+
+    def test_text_keeps_stdlib_extra(self):
+        """Test TextFormatter appends fields passed through stdlib extra=."""
+        record = _stdlib_record(session_id="abcd", user="bob")
+        assert TextFormatter("%(message)s").format(record) == "hello user=bob"
+
+    def test_json_keeps_stdlib_extra(self):
+        """Test JsonFormatter keeps stdlib extra= fields, with and without a session_id."""
+        for extra in ({"user": "bob"}, {"session_id": "abcd", "user": "bob"}):
+            data = json.loads(JsonFormatter().format(_stdlib_record(**extra)))
+            assert data["user"] == "bob"
+            assert data["message"] == "hello"
+
+    def test_structured_records_with_and_without_fields(self, records):
+        """Test StructuredLogger records format their kwargs and nothing else."""
+        structured, emitted = records
+        structured.info("plain")
+        structured.info("fields", user="bob", count=2)
+        text = TextFormatter("%(message)s")
+        assert text.format(emitted[0]) == "plain"
+        assert text.format(emitted[1]) == "fields user=bob count=2"
+        plain = json.loads(JsonFormatter().format(emitted[0]))
+        assert set(plain) == {"timestamp", "level", "message", "logger", "session_id"}
+        assert json.loads(JsonFormatter().format(emitted[1]))["count"] == 2
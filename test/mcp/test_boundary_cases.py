@@ -69,6 +69,26 @@ class TestElementwiseBoundaries:
         assert result.result == 3.0
         assert result.shape == []  # Scalar has empty shape
 
+    @pytest.mark.parametrize("operation,a,b", [
+        ("floor", -0.0, None),
+        ("ceil", -0.3, None),
+        ("round", -0.3, None),
+        ("round", -0.5, None),
+        ("relu", -0.0, None),
+        ("maximum", 0.0, -0.0),
+        ("maximum", -0.0, 0.0),
+        ("minimum", 0.0, -0.0),
+        ("minimum", -0.0, 0.0),
+    ])
+    def test_signed_zero_scalar_matches_array(self, capability, operation, a, b):
+        """Test the scalar path keeps the array path's sign of zero."""
+        scalar = capability.compute(operation=operation, a=a, b=b, precision="float64")
+        array = capability.compute(
+            operation=operation, a=[a], b=None if b is None else [b], precision="float64"
+        )
+        assert scalar.result == 0.0
+        assert math.copysign(1.0, scalar.result) == math.copysign(1.0, array.result[0])
+
     def test_divide_by_zero(self, capability):
         """Test division by zero produces infinity, not error."""
         result = capability.compute(
@@ -165,6 +185,80 @@ class TestElementwiseBoundaries:
             )
 
 
+class TestElementwiseExprBoundaries:
+    """Test boundary cases for chained elementwise expressions."""
+
+    @pytest.fixture
+    def capability(self):
+        return ElementwiseCapability()
+
+    def test_chain_matches_separate_calls(self, capability):
+        """Test sigmoid(a) + b equals the two single-op calls."""
+        a = [-1.0, 0.0, 2.0]
+        b = [1.0, 2.0, 3.0]
+        step = capability.compute(operation="sigmoid", a=a, b=None, precision="float64")
+        expected = capability.compute(operation="add", a=step.result, b=b, precision="float64")
+
+        result = capability.compute_expr(a, [{"op": "sigmoid"}, {"op": "add", "b": b}])
+        assert result.result == expected.result
+        assert result.shape == [3]
+
+    def test_chain_broadcast_grows_shape(self, capability):
+        """Test a scalar operand broadcast against an array mid-chain."""
+        result = capability.compute_expr(2.0, [{"op": "square"}, {"op": "multiply", "b": [1, 2]}])
+        assert result.result == [4.0, 8.0]
+        assert result.shape == [2]
+
+    def test_chain_comparison_result_is_bool(self, capability):
+        """Test a comparison as the last step yields booleans."""
+        result = capability.compute_expr([1, 5], [{"op": "greater", "b": 2}])
+        assert result.result == [False, True]
+        assert result.dtype == "bool"
+
+    def test_chain_step_missing_b(self, capability):
+        """Test a binary step without b is rejected with its index."""
+        with pytest.raises(InvalidInputError, match="step 1"):
+            capability.compute_expr([1, 2], [{"op": "exp"}, {"op": "add"}])
+
+    def test_b64_round_trip(self, capability):
+        """Test the base64 return format rebuilds the list result."""
+        import base64
+        import numpy as np
+
+        a = [[1.0, 4.0], [9.0, 16.0]]
+        listed = capability.compute_expr(a, [{"op": "sqrt"}, {"op": "add", "b": 1}])
+        packed = capability.compute_expr(
+            a, [{"op": "sqrt"}, {"op": "add", "b": 1}], return_format="b64"
+        )
+        rebuilt = np.frombuffer(base64.b64decode(packed.result), dtype=packed.dtype)
+        assert rebuilt.reshape(packed.shape).tolist() == listed.result
+        assert packed.shape == listed.shape
+
+    def test_unknown_return_format(self, capability):
+        """Test an unknown return format is rejected."""
+        with pytest.raises(InvalidInputError, match="return_format"):
+            capability.compute("sqrt", [4], return_format="csv")
+
+    def test_batch_runs_each_entry(self, capability):
+        """Test a batch returns one result per entry, in order."""
+        result = capability.compute_batch([
+            {"operation": "sqrt", "a": [4, 9]},
+            {"operation": "add", "a": 1, "b": 2},
+        ])
+        assert result.result["results"] == [
+            {"result": [2.0, 3.0], "shape": [2], "dtype": "float64"},
+            {"result": 3.0, "shape": [], "dtype": "float64"},
+        ]
+
+    def test_batch_error_names_entry(self, capability):
+        """Test a failing batch entry is reported with its index."""
+        with pytest.raises(InvalidInputError, match="Entry 1"):
+            capability.compute_batch([
+                {"operation": "sqrt", "a": [4]},
+                {"operation": "add", "a": [1]},
+            ])
+
+
 class TestCurveFitBoundaries:
     """Test boundary cases for curve fitting."""
 
@@ -182,6 +276,16 @@ class TestCurveFitBoundaries:
         })
         assert result.result["quality"]["r_squared"] > 0.99
 
+    def test_minimum_points_sigmoid(self, capability):
+        """Test a sigmoid (4 params) fits on exactly 3 points."""
+        result = capability.handle("curve_fit", {
+            "x": [1, 2, 3],
+            "y": [0.5, 0.9, 1.1],
+            "model_type": "sigmoid"
+        })
+        assert result.result["model_type"] == "sigmoid"
+        assert result.result["quality"]["r_squared"] > 0.99
+
     def test_two_points_error(self, capability):
         """Test error with only 2 points."""
         with pytest.raises(InvalidInputError, match="At least 3"):
@@ -147,6 +147,17 @@ class TestCurveFit:
         assert abs(preds[0] - 8.0) < 0.01
         assert abs(preds[1] - 10.0) < 0.01
 
+    def test_repeated_fit_reuses_model(self, curve_fit_cap):
+        """Test that identical fit requests share a model_id."""
+        args = {"x": [1, 2, 3, 4], "y": [2, 4, 6, 8.5], "model_type": "polynomial", "degree": 1}
+
+        first = curve_fit_cap.handle("curve_fit", args).result
+        second = curve_fit_cap.handle("curve_fit", args).result
+        other = curve_fit_cap.handle("curve_fit", dict(args, degree=2)).result
+
+        assert first == second
+        assert other["model_id"] != first["model_id"]
+
     def test_errors(self, curve_fit_cap):
         """Test error handling."""
         # Mismatched lengths
@@ -96,3 +96,11 @@ class TestFinancialPV:
                 "rate": [0.05], # Only one rate for two flows
                 "times": [1, 2]
             })
+
+        # Discrete discounting needs rate > -100%
+        with pytest.raises(InvalidInputError, match="greater than -1.0"):
+            fin_cap.handle("financial_pv", {
+                "cash_flows": [100, 200],
+                "rate": [0.05, -1.0],
+                "times": [1, 2]
+            })
@@ -201,3 +201,32 @@ class TestFinancialOptionPricing:
             "option_type": "put", "exercise_style": "european"
         })
         assert result_put.result["rho"] < 0
+
+    def test_black_scholes_matches_deep_tree(self, fin_cap):
+        """Black-Scholes closed form agrees with a deep binomial tree."""
+        params = {
+            "S": 105, "K": 100, "T": 0.75, "r": 0.05, "q": 0.03, "sigma": 0.25,
+            "option_type": "put", "exercise_style": "european"
+        }
+        bs = fin_cap.handle("financial_option_price", {**params, "model": "black_scholes"}).result
+        tree = fin_cap.handle("financial_option_price", {**params, "steps": 2000}).result
+
+        assert bs["model"] == "Black-Scholes"
+        assert bs["price"] == pytest.approx(tree["price"], abs=2e-3)
+        assert bs["delta"] == pytest.approx(tree["delta"], abs=1e-4)
+        assert bs["gamma"] == pytest.approx(tree["gamma"], abs=1e-4)
+        assert bs["theta"] == pytest.approx(tree["theta"], abs=1e-4)
+
+        # Textbook value for S=K=100, T=1, r=5%, sigma=20%
+        atm = fin_cap.handle("financial_option_price", {
+            "S": 100, "K": 100, "T": 1, "r": 0.05, "sigma": 0.2,
+            "option_type": "call", "exercise_style": "european", "model": "black_scholes"
+        })
+        assert atm.result["price"] == pytest.approx(10.4506, abs=1e-4)
+
+    def test_black_scholes_rejects_american(self, fin_cap):
+        with pytest.raises(InvalidInputError, match="European"):
+            fin_cap.handle("financial_option_price", {
+                "S": 100, "K": 100, "T": 1, "r": 0.05, "sigma": 0.2,
+                "option_type": "put", "exercise_style": "american", "model": "black_scholes"
+            })
@@ -1,5 +1,7 @@
 """Tests for Financial Technical Indicators."""
 
+import math
+
 import pytest
 from app.math_engine.capabilities.financial import FinancialCapability
 
@@ -67,6 +69,66 @@ class TestFinancialTechnicals:
         assert data["lower_band"][-1] == 10.0
         assert data["middle_band"][-1] == 10.0
 
+    def test_bollinger_matches_window_std(self, fin_cap):
+        """Test Bollinger Bands against a direct per-window mean and std."""
+        prices = [100 + 3 * math.sin(i / 3) + (i % 7) * 0.5 for i in range(60)]
+        window = 10
+        result = fin_cap.handle("financial_technical_indicators", {
+            "indicator": "bollinger",
+            "prices": prices,
+            "params": {"window": window, "num_std": 2}
+        })
+        data = result.result
+        for i in range(window - 1, len(prices)):
+            chunk = prices[i - window + 1:i + 1]
+            mean = sum(chunk) / window
+            std = math.sqrt(sum((p - mean) ** 2 for p in chunk) / window)
+            assert data["middle_band"][i] == pytest.approx(mean, rel=1e-12)
+            assert data["upper_band"][i] == pytest.approx(mean + 2 * std, rel=1e-12)
+
+    def test_bollinger_long_stepped_series(self, fin_cap):
+        """Test Bollinger Bands on a long trending, stepped series stay exact."""
+        import numpy as np
+        from numpy.lib.stride_tricks import sliding_window_view
+
+        # Flat 100-point steps climbing from 1e3 to 1e5, with noisy ramps between
+        rng = np.random.default_rng(7)
+        levels = np.linspace(1e3, 1e5, 1000)
+        prices = np.concatenate([
+            np.concatenate([np.full(100, lvl), lvl + rng.normal(0, 5, 20)]) for lvl in levels
+        ])
+        window = 20
+        data = fin_cap.handle("financial_technical_indicators", {
+            "indicator": "bollinger",
+            "prices": prices.tolist(),
+            "params": {"window": window, "num_std": 2}
+        }).result
+        windows = sliding_window_view(prices, window)
+        mean = windows.mean(axis=1)
+        std = windows.std(axis=1)
+        middle = np.array(data["middle_band"][window - 1:])
+        half_width = (np.array(data["upper_band"][window - 1:]) - middle) / 2
+        assert np.allclose(middle, mean, rtol=1e-12, atol=0)
+        assert np.allclose(half_width, std, rtol=0, atol=1e-6)
+        flat = (windows == windows[:, :1]).all(axis=1)
+        assert flat.sum() > 50000
+        assert (half_width[flat] == 0.0).all()
+
+    def test_b64_series_round_trip(self, fin_cap):
+        """Test the base64 series format decodes to the list values, NaN padding kept."""
+        import base64
+        import numpy as np
+
+        prices = [10, 11, 12, 13, 14, 13, 12]
+        args = {"indicator": "sma", "prices": prices, "params": {"window": 3}}
+        listed = fin_cap.handle("financial_technical_indicators", args).result["values"]
+        packed = fin_cap.handle(
+            "financial_technical_indicators", {**args, "return_format": "b64"}
+        ).result["values"]
+        decoded = np.frombuffer(base64.b64decode(packed), dtype="<f8")
+        assert np.isnan(decoded[:2]).all()
+        assert decoded[2:].tolist() == listed[2:]
+
     def test_pe_ratio(self, fin_cap):
         """Test PE Ratio."""
         result = fin_cap.handle("financial_technical_indicators", {